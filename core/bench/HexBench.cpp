@@ -0,0 +1,108 @@
+#include "HexBoard.hpp"
+#include "HexAI.hpp"
+
+#include <string>
+#include <thread>
+#include <vector>
+#include <iomanip>
+#include <fstream>
+#include <iostream>
+
+#if defined(_WIN32)
+#include <windows.h>
+#include <psapi.h>
+#pragma comment(lib, "psapi.lib")
+#elif defined(__linux__)
+#include <unistd.h>
+#endif
+
+// Large-board benchmark: one timed search from the empty board per size,
+// reporting search throughput and the memory the search allocated.
+// Usage: hex_bench [time_ms] [sizes...]   (defaults: 2000 ms, 7 9 11 13 15 19 25)
+
+namespace {
+
+    // Resident set size of the process in bytes, 0 where unsupported
+    size_t resident_bytes() {
+#if defined(_WIN32)
+        PROCESS_MEMORY_COUNTERS pmc;
+        if (GetProcessMemoryInfo(GetCurrentProcess(), &pmc, sizeof(pmc)))
+            return pmc.WorkingSetSize;
+
+        return 0;
+#elif defined(__linux__)
+        std::ifstream statm("/proc/self/statm");
+        size_t pages = 0, resident = 0;
+
+        if (statm >> pages >> resident)
+            return resident * static_cast<size_t>(sysconf(_SC_PAGESIZE));
+
+        return 0;
+#else
+        return 0;
+#endif
+    }
+
+    struct BenchResult {
+        SearchStats stats;
+        size_t memory = 0;
+    };
+
+    // Runs on its own thread so the search's thread-local tree and buffers
+    // start empty and are released before the next size
+    BenchResult bench_size(int size, int time_ms) {
+        BenchResult result;
+
+        std::thread worker([&] {
+            HexBoard game(size, size);
+
+            SearchConfig cfg;
+            cfg.time_limit_ms = time_ms;
+
+            size_t before = resident_bytes();
+            HexAI::get_move(game, PLAYER_1, cfg);
+            size_t after = resident_bytes();
+
+            result.stats = HexAI::get_last_stats();
+            result.memory = after > before ? after - before : 0;
+        });
+
+        worker.join();
+        return result;
+    }
+}
+
+int main(int argc, char** argv) {
+    int time_ms = 2'000;
+    std::vector<int> sizes = {7, 9, 11, 13, 15, 19, 25};
+
+    if (argc > 1)
+        time_ms = std::stoi(argv[1]);
+
+    if (argc > 2) {
+        sizes.clear();
+        for (int i = 2; i < argc; ++i)
+            sizes.push_back(std::stoi(argv[i]));
+    }
+
+    std::cout << "=== LARGE BOARD BENCHMARK (" << time_ms << " ms per size) ===\n";
+    std::cout << std::left << std::setw(8) << "Size" << std::right
+              << std::setw(12) << "Playouts" << std::setw(14) << "Playouts/s"
+              << std::setw(12) << "Nodes" << std::setw(12) << "Memory MB"
+              << std::setw(12) << "Bytes/node" << "\n";
+    std::cout << std::string(70, '-') << "\n";
+
+    for (int size : sizes) {
+        BenchResult r = bench_size(size, time_ms);
+        double mb = r.memory / (1024.0 * 1024.0);
+        double per_node = r.stats.nodes > 0 ? static_cast<double>(r.memory) / r.stats.nodes : 0.0;
+
+        std::string label = std::to_string(size) + "x" + std::to_string(size);
+        std::cout << std::left << std::setw(8) << label << std::right << std::fixed << std::setprecision(0)
+                  << std::setw(12) << r.stats.playouts << std::setw(14) << r.stats.playouts_per_sec
+                  << std::setw(12) << r.stats.nodes << std::setprecision(1) << std::setw(12) << mb
+                  << std::setprecision(0) << std::setw(12) << per_node << "\n";
+    }
+
+    return 0;
+}
@@ -1,8 +1,12 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h> 
+#include <pybind11/numpy.h>
+
+#include <string>
 
 #include "HexBoard.hpp"
 #include "HexAI.hpp"
+#include "PatternTable.hpp"
 
 namespace py = pybind11;
 
@@ -21,12 +25,14 @@ PYBIND11_MODULE(hexlib, m) {
 
     py::class_<HexBoard>(m, "HexBoard")
         .def(py::init<int, int>(), "Initialize Board (rows, cols)")
+        .def(py::init<const HexBoard&>(), "Copy an existing board")
         
         .def_readonly("rows", &HexBoard::rows)
         .def_readonly("cols", &HexBoard::cols)
         
         .def("make_move", &HexBoard::make_move)
         .def("check_win", &HexBoard::check_win)
+        .def("undo", &HexBoard::undo, "Take back the last move, False when the board is empty")
         .def("get_legal_moves", &HexBoard::get_legal_moves)
         .def("get_winning_path", &HexBoard::get_winning_path)
         .def("get_shortest_distance", &HexBoard::get_shortest_distance)
@@ -34,11 +40,129 @@ PYBIND11_MODULE(hexlib, m) {
         .def("get_coord", &HexBoard::get_coord)
         .def("get_index", &HexBoard::get_index)
         .def("get_cell", &HexBoard::get_cell)
+        .def("get_history", &HexBoard::get_history)
+        .def("apply_moves", [](HexBoard& self, py::array_t<int, py::array::c_style | py::array::forcecast> moves, int first_player) {
+                const int* data = moves.data();
+                return self.apply_moves(std::vector<int>(data, data + moves.size()), first_player);
+            }, py::arg("moves"), py::arg("first_player") = PLAYER_1,
+            "Play a sequence of cell indices with alternating colours, returns how many were applied")
+
+        .def("clone", [](const HexBoard& self) { return HexBoard(self); })
+        .def("__copy__", [](const HexBoard& self) { return HexBoard(self); })
+        .def("__deepcopy__", [](const HexBoard& self, py::dict) { return HexBoard(self); }, py::arg("memo"))
+
+        .def("to_bytes", [](const HexBoard& self, bool include_dsu) { 
+                return py::bytes(self.serialize(include_dsu)); 
+            }, py::arg("include_dsu") = false)
+        .def_static("from_bytes", [](const py::bytes& data) { 
+                return HexBoard::deserialize(data); 
+            }, py::arg("data"))
+
+        .def(py::pickle(
+            [](const HexBoard& self) { return py::bytes(self.serialize()); },
+            [](const py::bytes& data) { return HexBoard::deserialize(data); }))
         
         .def("print_board", &HexBoard::print_board);
 
+    py::class_<SearchConfig>(m, "SearchConfig")
+        .def(py::init<>())
+        .def_static("from_difficulty", &SearchConfig::from_difficulty, py::arg("difficulty"))
+
+        .def_readwrite("time_limit_ms", &SearchConfig::time_limit_ms)
+        .def_readwrite("max_iterations", &SearchConfig::max_iterations)
+        .def_readwrite("node_pool_size", &SearchConfig::node_pool_size)
+        .def_readwrite("uct_exploration", &SearchConfig::uct_exploration)
+        .def_readwrite("rave_bias", &SearchConfig::rave_bias)
+
+        .def_readwrite("use_priors", &SearchConfig::use_priors)
+        .def_readwrite("prior_visits", &SearchConfig::prior_visits)
+        .def_readwrite("prior_own_path", &SearchConfig::prior_own_path)
+        .def_readwrite("prior_opp_path", &SearchConfig::prior_opp_path)
+        .def_readwrite("prior_bridge", &SearchConfig::prior_bridge)
+        .def_readwrite("prior_pattern", &SearchConfig::prior_pattern)
+        .def_readwrite("prior_center", &SearchConfig::prior_center)
+        .def_readwrite("progressive_bias", &SearchConfig::progressive_bias)
+
+        .def_readwrite("use_solver", &SearchConfig::use_solver)
+        .def_readwrite("leaf_playouts", &SearchConfig::leaf_playouts)
+        .def_readwrite("leaf_threads", &SearchConfig::leaf_threads);
+
+    py::class_<PatternTable>(m, "PatternTable")
+        .def(py::init<>(), "Uniform weights (plain random playouts)")
+
+        .def_readonly_static("PATTERN_COUNT", &PatternTable::PATTERN_COUNT)
+
+        .def("get_weight", &PatternTable::get_weight, py::arg("player"), py::arg("code"))
+        .def("set_weight", &PatternTable::set_weight, py::arg("player"), py::arg("code"), py::arg("weight"))
+        .def("is_uniform", &PatternTable::is_uniform)
+        .def("load", &PatternTable::load, py::arg("path"))
+        .def("save", &PatternTable::save, py::arg("path"))
+        .def("train", &PatternTable::train, 
+                py::arg("games"), py::arg("rows"), py::arg("cols"), py::arg("prior") = 1.0f,
+                py::call_guard<py::gil_scoped_release>());
+
+    py::class_<SearchStats>(m, "SearchStats")
+        .def(py::init<>())
+
+        .def_readonly("iterations", &SearchStats::iterations)
+        .def_readonly("playouts", &SearchStats::playouts)
+        .def_readonly("nodes", &SearchStats::nodes)
+        .def_readonly("max_depth", &SearchStats::max_depth)
+        .def_readonly("avg_depth", &SearchStats::avg_depth)
+        .def_readonly("avg_playout_length", &SearchStats::avg_playout_length)
+        .def_readonly("solved", &SearchStats::solved)
+        .def_readonly("elapsed_ms", &SearchStats::elapsed_ms)
+        .def_readonly("playouts_per_sec", &SearchStats::playouts_per_sec)
+
+        .def_readonly("profiled", &SearchStats::profiled)
+        .def_readonly("selection_ms", &SearchStats::selection_ms)
+        .def_readonly("expansion_ms", &SearchStats::expansion_ms)
+        .def_readonly("simulation_ms", &SearchStats::simulation_ms)
+        .def_readonly("backpropagation_ms", &SearchStats::backpropagation_ms)
+
+        .def("__repr__", [](const SearchStats& s) {
+            return "<SearchStats iterations=" + std::to_string(s.iterations) +
+                   " nodes=" + std::to_string(s.nodes) +
+                   " max_depth=" + std::to_string(s.max_depth) +
+                   " elapsed_ms=" + std::to_string(s.elapsed_ms) + ">";
+        });
+
+    py::class_<AnalysisSnapshot>(m, "AnalysisSnapshot")
+        .def(py::init<>())
+
+        .def_readonly("searching", &AnalysisSnapshot::searching)
+        .def_readonly("ply", &AnalysisSnapshot::ply)
+        .def_readonly("player", &AnalysisSnapshot::player)
+        .def_readonly("iterations", &AnalysisSnapshot::iterations)
+        .def_readonly("token", &AnalysisSnapshot::token)
+        .def_readonly("value", &AnalysisSnapshot::value)
+        .def_readonly("moves", &AnalysisSnapshot::moves)
+        .def_readonly("visits", &AnalysisSnapshot::visits)
+        .def_readonly("win_rates", &AnalysisSnapshot::win_rates)
+        .def_readonly("pv", &AnalysisSnapshot::pv);
+
     py::class_<HexAI>(m, "HexAI")
-        .def_static("get_move", &HexAI::get_move,
+        .def_static("get_move", py::overload_cast<HexBoard&, int, Difficulty>(&HexAI::get_move),
                 py::arg("game"), py::arg("player"), py::arg("difficulty"),
-                py::call_guard<py::gil_scoped_release>());
+                py::call_guard<py::gil_scoped_release>())
+        .def_static("get_move", py::overload_cast<HexBoard&, int, const SearchConfig&>(&HexAI::get_move),
+                py::arg("game"), py::arg("player"), py::arg("config"),
+                py::call_guard<py::gil_scoped_release>())
+        .def_static("get_move", py::overload_cast<HexBoard&, int, const SearchConfig&, uint64_t>(&HexAI::get_move),
+                py::arg("game"), py::arg("player"), py::arg("config"), py::arg("stop_token"),
+                py::call_guard<py::gil_scoped_release>())
+
+        .def_static("set_profiling", &HexAI::set_profiling,
+                py::arg("enabled"), py::arg("trace_path") = "")
+        .def_static("is_profiling", &HexAI::is_profiling)
+        .def_static("get_last_stats", &HexAI::get_last_stats)
+
+        .def_static("get_analysis", &HexAI::get_analysis)
+        .def_static("set_analysis_interval", &HexAI::set_analysis_interval, py::arg("interval_ms"))
+        .def_static("load_patterns", &HexAI::load_patterns, py::arg("path"))
+        .def_static("set_patterns", &HexAI::set_patterns, py::arg("table"))
+        .def_static("get_patterns", &HexAI::get_patterns)
+
+        .def_static("stop", &HexAI::stop)
+        .def_static("stop_token", &HexAI::stop_token);
 }
@@ -0,0 +1,258 @@
+#ifndef FIXED_HEX_BOARD_HPP
+#define FIXED_HEX_BOARD_HPP
+
+#include "HexBoard.hpp"
+
+#include <array>
+#include <deque>
+#include <cstdint>
+#include <utility>
+
+// Board sizes with compile-time specialized search kernels
+#define HEX_FIXED_SIZES(X) X(7) X(9) X(11) X(13) X(15) X(19)
+
+// Neighbour tables of an S x S board, built at compile time.
+// Cell and virtual node indices match HexBoard
+template <int S>
+struct HexTopology {
+    static constexpr int N = S * S;
+    static constexpr int TOP = N, BOTTOM = N + 1, LEFT = N + 2, RIGHT = N + 3;
+
+    // Bits of edge_mask
+    static constexpr uint8_t EDGE_TOP = 1, EDGE_BOTTOM = 2, EDGE_LEFT = 4, EDGE_RIGHT = 8;
+
+    struct Neighbors {
+        std::array<int, 6> cells{};
+        int count = 0;
+
+        constexpr const int* begin() const { return cells.data(); }
+        constexpr const int* end() const { return cells.data() + count; }
+    };
+
+    // Virtual edge nodes first, then cells (same order as HexBoard)
+    std::array<Neighbors, N> adj{};
+
+    // Cells only, for the hot loops
+    std::array<Neighbors, N> cells{};
+    std::array<uint8_t, N> edge_mask{};
+
+    // Cells along each virtual node, indexed by node - N
+    std::array<std::array<int, S>, 4> edges{};
+
+    constexpr HexTopology() {
+        constexpr int even_offsets[6][2] = {{-1, -1}, {-1, 0}, {0, -1}, {0, 1}, {1, -1}, {1, 0}};
+        constexpr int odd_offsets[6][2] = {{-1, 0}, {-1, 1}, {0, -1}, {0, 1}, {1, 0}, {1, 1}};
+
+        for (int r = 0; r < S; ++r) {
+            for (int c = 0; c < S; ++c) {
+                const int idx = r * S + c;
+                auto& a = adj[idx];
+
+                if (r == 0)     { a.cells[a.count++] = TOP;    edge_mask[idx] |= EDGE_TOP; }
+                if (r == S - 1) { a.cells[a.count++] = BOTTOM; edge_mask[idx] |= EDGE_BOTTOM; }
+                if (c == 0)     { a.cells[a.count++] = LEFT;   edge_mask[idx] |= EDGE_LEFT; }
+                if (c == S - 1) { a.cells[a.count++] = RIGHT;  edge_mask[idx] |= EDGE_RIGHT; }
+
+                for (int k = 0; k < 6; ++k) {
+                    const int nr = r + ((r % 2 == 0) ? even_offsets[k][0] : odd_offsets[k][0]);
+                    const int nc = c + ((r % 2 == 0) ? even_offsets[k][1] : odd_offsets[k][1]);
+
+                    if (nr >= 0 && nr < S && nc >= 0 && nc < S) {
+                        a.cells[a.count++] = nr * S + nc;
+                        cells[idx].cells[cells[idx].count++] = nr * S + nc;
+                    }
+                }
+            }
+        }
+
+        for (int i = 0; i < S; ++i) {
+            edges[TOP - N][i]    = i;
+            edges[BOTTOM - N][i] = (S - 1) * S + i;
+            edges[LEFT - N][i]   = i * S;
+            edges[RIGHT - N][i]  = i * S + S - 1;
+        }
+    }
+};
+
+// Union-find over a fixed number of nodes, path halving + union by rank
+template <int M>
+class FixedDSU {
+public:
+    FixedDSU() {
+        for (int i = 0; i < M; ++i)
+            parent[i] = static_cast<int16_t>(i);
+
+        rank.fill(0);
+    }
+
+    int find(int i) {
+        while (parent[i] != i) {
+            parent[i] = parent[parent[i]];
+            i = parent[i];
+        }
+
+        return i;
+    }
+
+    void unite(int i, int j) {
+        int root_i = find(i);
+        int root_j = find(j);
+
+        if (root_i != root_j) {
+            if (rank[root_i] < rank[root_j])
+                std::swap(root_i, root_j);
+
+            parent[root_j] = static_cast<int16_t>(root_i);
+            if (rank[root_i] == rank[root_j])
+                rank[root_i]++;
+        }
+    }
+
+    bool connected(int i, int j) {
+        return find(i) == find(j);
+    }
+
+private:
+    std::array<int16_t, M> parent;
+    std::array<uint8_t, M> rank;
+};
+
+// Square board with compile-time size: fixed arrays (copies never allocate) and
+// constexpr neighbour tables. Implements the subset of HexBoard the search uses
+template <int S>
+class FixedHexBoard {
+public:
+    using Topology = HexTopology<S>;
+
+    static constexpr int rows = S;
+    static constexpr int cols = S;
+    static constexpr int N = S * S;
+    static constexpr Topology topology{};
+
+    FixedHexBoard() {
+        board.fill(EMPTY);
+    }
+
+    explicit FixedHexBoard(const HexBoard& other) : FixedHexBoard() {
+        for (int i = 0; i < N; ++i) {
+            int cell = other.get_cell_by_index(i);
+            if (cell != EMPTY)
+                play(i, cell);
+        }
+    }
+
+    int get_cell_by_index(int idx) const {
+        return board[idx];
+    }
+
+    std::pair<int, int> get_coord(int idx) const {
+        return {idx / S, idx % S};
+    }
+
+    const typename Topology::Neighbors& get_neighbors(int idx) const {
+        return topology.adj[idx];
+    }
+
+    bool make_move(int r, int c, int player) {
+        if (r < 0 || r >= S || c < 0 || c >= S || board[r * S + c] != EMPTY)
+            return false;
+
+        play(r * S + c, player);
+        return true;
+    }
+
+    // Unchecked placement on an empty cell
+    void play(int idx, int player) {
+        board[idx] = static_cast<int8_t>(player);
+
+        const uint8_t edges = topology.edge_mask[idx];
+
+        if (player == PLAYER_1) {
+            for (int nb : topology.cells[idx])
+                if (board[nb] == PLAYER_1)
+                    dsu_p1.unite(idx, nb);
+
+            if (edges & Topology::EDGE_LEFT)  dsu_p1.unite(idx, Topology::LEFT);
+            if (edges & Topology::EDGE_RIGHT) dsu_p1.unite(idx, Topology::RIGHT);
+        } else {
+            for (int nb : topology.cells[idx])
+                if (board[nb] == PLAYER_2)
+                    dsu_p2.unite(idx, nb);
+
+            if (edges & Topology::EDGE_TOP)    dsu_p2.unite(idx, Topology::TOP);
+            if (edges & Topology::EDGE_BOTTOM) dsu_p2.unite(idx, Topology::BOTTOM);
+        }
+    }
+
+    int check_win() {
+        if (dsu_p1.connected(Topology::LEFT, Topology::RIGHT))
+            return PLAYER_1;
+
+        if (dsu_p2.connected(Topology::TOP, Topology::BOTTOM))
+            return PLAYER_2;
+
+        return EMPTY;
+    }
+
+    // Same contract as HexBoard::get_distance_map
+    int get_distance_map(int player, bool reverse, std::vector<int>& dist) const {
+        int start = (player == PLAYER_1) ? Topology::LEFT : Topology::TOP;
+        int end   = (player == PLAYER_1) ? Topology::RIGHT : Topology::BOTTOM;
+
+        if (reverse)
+            std::swap(start, end);
+
+        std::deque<int> dq;
+        dist.assign(N + 4, 9999);
+
+        dist[start] = 0;
+        dq.push_front(start);
+
+        auto relax = [&](int u, int v) {
+            int weight = 0;
+
+            if (v < N) {
+                if (board[v] == EMPTY)
+                    weight = 1;
+                else if (board[v] != player)
+                    return;
+
+            } else if (v != end) {
+                return;
+            }
+
+            if (dist[v] > dist[u] + weight) {
+                dist[v] = dist[u] + weight;
+                if (weight == 0)
+                    dq.push_front(v);
+                else
+                    dq.push_back(v);
+            }
+        };
+
+        while (!dq.empty()) {
+            int u = dq.front();
+            dq.pop_front();
+
+            if (u == end)
+                continue;
+
+            if (u >= N) {
+                for (int v : topology.edges[u - N])
+                    relax(u, v);
+            } else {
+                for (int v : topology.adj[u])
+                    relax(u, v);
+            }
+        }
+
+        return dist[end];
+    }
+
+private:
+    std::array<int8_t, N> board;
+    FixedDSU<N + 4> dsu_p1;
+    FixedDSU<N + 4> dsu_p2;
+};
+
+#endif // FIXED_HEX_BOARD_HPP
@@ -2,14 +2,118 @@
 #define HEX_AI_HPP
 
 #include "HexBoard.hpp"
+#include "PatternTable.hpp"
+
+#include <string>
+#include <cstdint>
+#include <vector>
 
 enum class Difficulty { 
     EASY, MEDIUM, HARD 
 };
 
+// Tunable search parameters, the Difficulty presets map onto these
+struct SearchConfig {
+    int time_limit_ms = 1'000;  // 0 = bounded by iterations only
+    int max_iterations = 0;     // 0 = bounded by time only
+    int node_pool_size = 0;     // 0 = scale with board area
+
+    double uct_exploration = 0.2;
+    double rave_bias = 3'000.0;
+
+    // Node priors: new children start with virtual visits at a heuristic win rate
+    bool use_priors = true;
+    int prior_visits = 8;
+    double prior_own_path = 0.15;   // Shortens the mover's shortest path
+    double prior_opp_path = 0.10;   // Sits on an opponent shortest path
+    double prior_bridge = 0.10;
+    double prior_pattern = 0.10;
+    double prior_center = 0.05;
+    double progressive_bias = 0.5;
+
+    // Propagate proven wins/losses (MCTS-Solver)
+    bool use_solver = true;
+
+    // Leaf parallelism: playouts per expanded leaf, backed up in one pass,
+    // spread over this many helper threads besides the search thread
+    int leaf_playouts = 1;
+    int leaf_threads = 0;
+
+    static SearchConfig from_difficulty(Difficulty diff);
+};
+
+// Counters collected by the last search.
+// Phase timings are only filled when profiling is enabled at runtime
+// and compiled in (HEX_PROFILING).
+struct SearchStats {
+    int iterations = 0;
+    int playouts = 0;
+    int nodes = 0;
+    int max_depth = 0;
+    double avg_depth = 0.0;
+    double avg_playout_length = 0.0;
+
+    // Proven outcome for the searching player: 1 win, -1 loss, 0 open
+    int solved = 0;
+
+    double elapsed_ms = 0.0;
+    double playouts_per_sec = 0.0;
+
+    bool profiled = false;
+    double selection_ms = 0.0;
+    double expansion_ms = 0.0;
+    double simulation_ms = 0.0;
+    double backpropagation_ms = 0.0;
+};
+
+// Periodic view of a running search, published for the GUI
+struct AnalysisSnapshot {
+    bool searching = false;
+    int ply = 0;            // Stones on the searched position
+    int player = EMPTY;     // Player to move at the root
+    int iterations = 0;
+    uint64_t token = 0;     // Stop token of the search that published it
+
+    // Root win rate for the player to move, from the root's own playouts
+    // (children start with prior visits, the root does not)
+    double value = 0.5;
+
+    // Root children, win rates are from the root player's view
+    std::vector<int> moves;
+    std::vector<int> visits;
+    std::vector<double> win_rates;
+
+    // Principal variation (most visited line)
+    std::vector<int> pv;
+};
+
 class HexAI {
 public:
     static int get_move(HexBoard& game, int player, Difficulty diff);
+    static int get_move(HexBoard& game, int player, const SearchConfig& config);
+
+    // Same, but the search also ends for any stop() issued after stop_token was
+    // taken, including one that lands before this call starts searching
+    static int get_move(HexBoard& game, int player, const SearchConfig& config, uint64_t stop_token);
+
+    // Empty trace_path disables Chrome trace-event export
+    static void set_profiling(bool enabled, const std::string& trace_path = "");
+    static bool is_profiling();
+    static SearchStats get_last_stats();
+
+    // Never blocks a running search, returns the latest published snapshot
+    static AnalysisSnapshot get_analysis();
+    static void set_analysis_interval(int interval_ms);
+
+    // Playout policy weights, a uniform table means plain random playouts
+    static bool load_patterns(const std::string& path);
+    static void set_patterns(const PatternTable& table);
+    static PatternTable get_patterns();
+
+    // Ends running searches early, they still return their best move.
+    // Stops every search whose token was taken before this call
+    static void stop();
+    static uint64_t stop_token();
 };
 
 #endif // HEX_AI_HPP
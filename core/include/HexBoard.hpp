@@ -1,8 +1,9 @@
 #ifndef HEX_BOARD_HPP
 #define HEX_BOARD_HPP
 
-#include "DSU.hpp"
+#include "RollbackDSU.hpp"
 
+#include <string>
 #include <vector>
 #include <memory>
 #include <utility>
@@ -24,20 +25,46 @@ public:
     int get_cell_by_index(int idx) const;
     std::pair<int, int> get_coord(int idx) const;
     const std::vector<int>& get_neighbors(int idx) const;
+    // Neighbour lists of cells and virtual edge nodes, shared by copies
+    std::shared_ptr<const std::vector<std::vector<int>>> get_adjacency() const;
     std::vector<int> get_legal_moves() const;
 
     bool make_move(int r, int c, int player);
     int check_win();
 
+    // Plays cell indices with alternating colours, starting with first_player.
+    // Stops at the first illegal move, returns how many were applied
+    int apply_moves(const std::vector<int>& moves, int first_player = PLAYER_1);
+
+    // Takes back the last move, false when the board is empty
+    bool undo();
+
+    // Cell indices in the order they were played
+    const std::vector<int>& get_history() const;
+
+    // Compact binary form: header, cells at 2 bits each, history as uint16,
+    // then optionally both DSUs with their undo logs (otherwise the history is
+    // replayed on load).
+    // deserialize throws std::invalid_argument on malformed data
+    std::string serialize(bool include_dsu = false) const;
+    static HexBoard deserialize(const std::string& data);
+
     int get_shortest_distance(int player) const;
+
+    // Per-cell 0-1 BFS cost from the player's first edge (or the opposite edge
+    // when reverse), counting the cell itself: empty = 1, own = 0, opponent = 9999.
+    // Returns the edge-to-edge distance
+    int get_distance_map(int player, bool reverse, std::vector<int>& dist) const;
     std::vector<int> get_winning_path(int player);
 
     void print_board() const;
 
 private:
     std::vector<int> board;
-    DSU dsu_p1;
-    DSU dsu_p2;
+    std::vector<int> history;
+    std::vector<int> undo_marks;    // Mover's DSU checkpoint before each move
+    RollbackDSU dsu_p1;
+    RollbackDSU dsu_p2;
 
     int VIRT_TOP, VIRT_BOTTOM;
     int VIRT_LEFT, VIRT_RIGHT;
@@ -45,7 +72,9 @@ private:
     std::shared_ptr<const std::vector<std::vector<int>>> adj;
 
     void build_adjacency();
-    bool dfs(int idx, int player, std::vector<bool>& visited, std::vector<int>& path);
+    void place(int idx, int player);
+    void connect(int idx, int player);
+    bool trace_path(int start, int player, std::vector<bool>& visited, std::vector<int>& path) const;
 };
 
 #endif // HEX_BOARD_HPP
@@ -0,0 +1,161 @@
+#ifndef LEAN_HEX_BOARD_HPP
+#define LEAN_HEX_BOARD_HPP
+
+#include "HexBoard.hpp"
+
+#include <deque>
+#include <memory>
+#include <vector>
+#include <cstdint>
+#include <utility>
+
+// Runtime-sized board for searching sizes without a FixedHexBoard kernel.
+// Keeps no history or undo logs, so copies (one per iteration and playout) are
+// three flat arrays; the adjacency is shared with the source HexBoard
+class LeanHexBoard {
+public:
+    const int rows;
+    const int cols;
+
+    explicit LeanHexBoard(const HexBoard& other)
+        : rows(other.rows), cols(other.cols), N(rows * cols), adj(other.get_adjacency()),
+          board(N, EMPTY), parent(2 * (N + 4)), rank(2 * (N + 4), 0) {
+        for (int i = 0; i < 2 * (N + 4); ++i)
+            parent[i] = i;
+
+        for (int i = 0; i < N; ++i) {
+            int cell = other.get_cell_by_index(i);
+            if (cell != EMPTY)
+                play(i, cell);
+        }
+    }
+
+    int get_cell_by_index(int idx) const {
+        return board[idx];
+    }
+
+    std::pair<int, int> get_coord(int idx) const {
+        return {idx / cols, idx % cols};
+    }
+
+    const std::vector<int>& get_neighbors(int idx) const {
+        return (*adj)[idx];
+    }
+
+    bool make_move(int r, int c, int player) {
+        if (r < 0 || r >= rows || c < 0 || c >= cols || board[r * cols + c] != EMPTY)
+            return false;
+
+        play(r * cols + c, player);
+        return true;
+    }
+
+    // Unchecked placement on an empty cell
+    void play(int idx, int player) {
+        board[idx] = static_cast<int8_t>(player);
+
+        for (int nb : (*adj)[idx]) {
+            if (nb < N) {
+                if (board[nb] == player)
+                    unite(player, idx, nb);
+
+            } else if (player == PLAYER_1 ? (nb == N + 2 || nb == N + 3) : (nb == N || nb == N + 1)) {
+                unite(player, idx, nb);
+            }
+        }
+    }
+
+    int check_win() {
+        if (find(PLAYER_1, N + 2) == find(PLAYER_1, N + 3))
+            return PLAYER_1;
+
+        if (find(PLAYER_2, N) == find(PLAYER_2, N + 1))
+            return PLAYER_2;
+
+        return EMPTY;
+    }
+
+    // Same contract as HexBoard::get_distance_map
+    int get_distance_map(int player, bool reverse, std::vector<int>& dist) const {
+        int start = (player == PLAYER_1) ? N + 2 : N;
+        int end   = (player == PLAYER_1) ? N + 3 : N + 1;
+
+        if (reverse)
+            std::swap(start, end);
+
+        std::deque<int> dq;
+        dist.assign(N + 4, 9999);
+
+        dist[start] = 0;
+        dq.push_front(start);
+
+        while (!dq.empty()) {
+            int u = dq.front();
+            dq.pop_front();
+
+            if (u == end)
+                continue;
+
+            for (int v : (*adj)[u]) {
+                int weight = 0;
+
+                if (v < N) {
+                    if (board[v] == EMPTY)
+                        weight = 1;
+                    else if (board[v] != player)
+                        continue;
+
+                } else if (v != end) {
+                    continue;
+                }
+
+                if (dist[v] > dist[u] + weight) {
+                    dist[v] = dist[u] + weight;
+                    if (weight == 0)
+                        dq.push_front(v);
+                    else
+                        dq.push_back(v);
+                }
+            }
+        }
+
+        return dist[end];
+    }
+
+private:
+    int N;
+    std::shared_ptr<const std::vector<std::vector<int>>> adj;
+    std::vector<int8_t> board;
+
+    // Both players' union-find in one array, PLAYER_2 at offset N + 4.
+    // Path halving + union by rank
+    std::vector<int> parent;
+    std::vector<uint8_t> rank;
+
+    int find(int player, int i) {
+        i += (player - 1) * (N + 4);
+
+        while (parent[i] != i) {
+            parent[i] = parent[parent[i]];
+            i = parent[i];
+        }
+
+        return i;
+    }
+
+    void unite(int player, int i, int j) {
+        int root_i = find(player, i);
+        int root_j = find(player, j);
+
+        if (root_i != root_j) {
+            if (rank[root_i] < rank[root_j])
+                std::swap(root_i, root_j);
+
+            parent[root_j] = root_i;
+            if (rank[root_i] == rank[root_j])
+                rank[root_i]++;
+        }
+    }
+};
+
+#endif // LEAN_HEX_BOARD_HPP
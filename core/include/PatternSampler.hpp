@@ -0,0 +1,157 @@
+#ifndef PATTERN_SAMPLER_HPP
+#define PATTERN_SAMPLER_HPP
+
+#include "PatternTable.hpp"
+
+#include <random>
+#include <vector>
+#include <algorithm>
+
+// Weighted playout move sampling over per-player weights kept in fixed-size
+// blocks: O(1) updates, O(N / BLOCK + BLOCK) draws. Pattern codes of
+// neighbours are updated incrementally as stones land
+struct PatternSampler {
+    static constexpr int BLOCK_SHIFT = 4;
+    static constexpr int BLOCK = 1 << BLOCK_SHIFT;
+
+    const PatternTable* table = nullptr;
+    int rows = 0, cols = 0, N = 0, block_count = 0;
+
+    std::vector<PatternTable::Slots> slots;
+    std::vector<int> cells;     // Current stones; a zero weight does not mean occupied
+    std::vector<int> codes;
+    std::vector<double> weights[2];
+    std::vector<double> blocks[2];
+    double total[2] = {0.0, 0.0};
+
+    std::vector<int> root_cells;
+    std::vector<int> root_codes;
+    std::vector<double> root_weights[2];
+    std::vector<double> root_blocks[2];
+    double root_total[2] = {0.0, 0.0};
+
+    // Full encode of the search root, playouts restore from this copy
+    template <class Board>
+    void prepare_root(const Board& board, const PatternTable* t) {
+        table = t;
+
+        if (board.rows != rows || board.cols != cols) {
+            rows = board.rows;
+            cols = board.cols;
+            N = rows * cols;
+            block_count = (N + BLOCK - 1) >> BLOCK_SHIFT;
+            slots = PatternTable::build_slots(rows, cols);
+        }
+
+        root_cells.resize(N);
+        codes.resize(N);
+        cells.resize(N);
+
+        for (int i = 0; i < N; ++i) {
+            root_cells[i] = board.get_cell_by_index(i);
+            codes[i] = PatternTable::encode(board, slots[i]);
+        }
+
+        for (int p = 0; p < 2; ++p) {
+            total[p] = 0.0;
+            weights[p].assign(N, 0.0);
+            blocks[p].assign(block_count, 0.0);
+
+            for (int i = 0; i < N; ++i) {
+                double w = (root_cells[i] == EMPTY) ? table->get_weight(p + 1, codes[i]) : 0.0;
+                weights[p][i] = w;
+                blocks[p][i >> BLOCK_SHIFT] += w;
+                total[p] += w;
+            }
+        }
+
+        cells = root_cells;
+        root_codes = codes;
+        for (int p = 0; p < 2; ++p) {
+            root_weights[p] = weights[p];
+            root_blocks[p] = blocks[p];
+            root_total[p] = total[p];
+        }
+    }
+
+    // Restores the root state and replays the stones the tree added
+    template <class Board>
+    void reset(const Board& board) {
+        cells = root_cells;
+        codes = root_codes;
+
+        for (int p = 0; p < 2; ++p) {
+            weights[p] = root_weights[p];
+            blocks[p] = root_blocks[p];
+            total[p] = root_total[p];
+        }
+
+        for (int i = 0; i < N; ++i) {
+            int cell = board.get_cell_by_index(i);
+            if (cell != root_cells[i]) 
+                place(i, cell);
+        }
+    }
+
+    void place(int idx, int player) {
+        cells[idx] = player;
+        set_weight(idx, 0.0, 0.0);
+
+        for (int s = 0; s < PatternTable::SLOTS; ++s) {
+            int nb = slots[idx][s];
+            if (nb == -1) 
+                continue;
+
+            // The new stone sits in the neighbour's opposite slot
+            codes[nb] |= player << PatternTable::shift(PatternTable::SLOTS - 1 - s);
+
+            if (cells[nb] == EMPTY) 
+                set_weight(nb, table->get_weight(PLAYER_1, codes[nb]), table->get_weight(PLAYER_2, codes[nb]));
+        }
+    }
+
+    // Returns -1 when all remaining weights are zero
+    int sample(int player, std::mt19937& rng) const {
+        const int p = player - 1;
+        if (total[p] <= 1e-9) 
+            return -1;
+
+        double u = std::uniform_real_distribution<double>(0.0, total[p])(rng);
+
+        int b = 0;
+        while (b < block_count - 1 && u >= blocks[p][b]) 
+            u -= blocks[p][b++];
+
+        int end = std::min(N, (b + 1) << BLOCK_SHIFT);
+        int last = -1;
+
+        for (int i = b << BLOCK_SHIFT; i < end; ++i) {
+            if (weights[p][i] <= 0.0) 
+                continue;
+
+            if (u < weights[p][i]) 
+                return i;
+
+            u -= weights[p][i];
+            last = i;
+        }
+
+        // Float drift past the block end
+        return last;
+    }
+
+private:
+    void set_weight(int idx, double w1, double w2) {
+        const double w[2] = {w1, w2};
+
+        for (int p = 0; p < 2; ++p) {
+            double delta = w[p] - weights[p][idx];
+
+            weights[p][idx] = w[p];
+            blocks[p][idx >> BLOCK_SHIFT] += delta;
+            total[p] += delta;
+        }
+    }
+};
+
+#endif // PATTERN_SAMPLER_HPP
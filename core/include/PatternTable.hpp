@@ -0,0 +1,65 @@
+#ifndef PATTERN_TABLE_HPP
+#define PATTERN_TABLE_HPP
+
+#include "HexBoard.hpp"
+
+#include <array>
+#include <string>
+#include <vector>
+
+// Weights of local 6-neighbourhood patterns, used by the playout policy.
+//
+// A pattern code packs the 6 neighbours of a cell, 2 bits each:
+// 0 = empty, 1 = PLAYER_1, 2 = PLAYER_2, 3 = off-board.
+// Slot order: up-left, up-right, left, right, down-left, down-right,
+// so the slot pointing back from a neighbour is always (5 - slot).
+class PatternTable {
+public:
+    static constexpr int SLOTS = 6;
+    static constexpr int OFF_BOARD = 3;
+    static constexpr int PATTERN_COUNT = 1 << (2 * SLOTS);
+
+    using Slots = std::array<int, SLOTS>;
+
+    PatternTable();
+
+    // Weight of playing into a cell with this pattern, for the player to move.
+    // Throws std::out_of_range for a bad player or code
+    float get_weight(int player, int code) const;
+    void set_weight(int player, int code, float weight);
+    bool is_uniform() const;
+
+    bool load(const std::string& path);
+    bool save(const std::string& path) const;
+
+    // Games are move index sequences, PLAYER_1 moves first.
+    // Weight = how often a pattern was played relative to how often it was available,
+    // smoothed towards 0.5 by `prior` (must be > 0) virtual observations
+    void train(const std::vector<std::vector<int>>& games, int rows, int cols, float prior = 1.0f);
+
+    static constexpr int shift(int slot) { 
+        return 2 * (SLOTS - 1 - slot); 
+    }
+
+    // Neighbour index per slot, -1 when off-board
+    static std::vector<Slots> build_slots(int rows, int cols);
+
+    // Board is any type with get_cell_by_index (HexBoard, FixedHexBoard)
+    template <class Board>
+    static int encode(const Board& board, const Slots& slots) {
+        int code = 0;
+
+        for (int s = 0; s < SLOTS; ++s) {
+            int state = (slots[s] == -1) ? OFF_BOARD : board.get_cell_by_index(slots[s]);
+            code |= state << shift(s);
+        }
+
+        return code;
+    }
+
+private:
+    std::vector<float> weights;     // [player - 1][code]
+    bool uniform;
+};
+
+#endif // PATTERN_TABLE_HPP
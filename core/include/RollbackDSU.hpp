@@ -0,0 +1,107 @@
+#ifndef ROLLBACK_DSU_HPP
+#define ROLLBACK_DSU_HPP
+
+#include <vector>
+#include <numeric>
+#include <utility>
+
+// Union-find that can undo unions: union by rank without path compression keeps
+// trees O(log N) deep, and every union is logged so it can be reverted in O(1)
+class RollbackDSU {
+public:
+    struct Union {
+        int child;      // Root attached under another root
+        bool bumped;    // Whether the new root's rank grew
+    };
+
+    explicit RollbackDSU(int n = 0);
+
+    void resize(int n);
+    int find(int i) const;
+    void unite(int i, int j);
+    bool connected(int i, int j) const;
+
+    // Log position to pass to rollback later
+    int checkpoint() const;
+    void rollback(int checkpoint);
+
+    // Raw state, for serialization
+    const std::vector<int>& get_parents() const { return parent; }
+    const std::vector<int>& get_ranks() const { return rank; }
+    const std::vector<Union>& get_log() const { return log; }
+    void set_state(std::vector<int> parents, std::vector<int> ranks, std::vector<Union> unions);
+
+private:
+    std::vector<int> parent;
+    std::vector<int> rank;
+    std::vector<Union> log;
+};
+
+inline RollbackDSU::RollbackDSU(int n) {
+    if (n > 0) 
+        resize(n);
+}
+
+inline void RollbackDSU::resize(int n) {
+    parent.resize(n);
+    rank.assign(n, 0);
+    std::iota(parent.begin(), parent.end(), 0);
+
+    // At most n - 1 unions can succeed
+    log.clear();
+    log.reserve(n);
+}
+
+inline int RollbackDSU::find(int i) const {
+    while (parent[i] != i) 
+        i = parent[i];
+
+    return i;
+}
+
+inline void RollbackDSU::unite(int i, int j) {
+    int root_i = find(i);
+    int root_j = find(j);
+
+    if (root_i != root_j) {
+        if (rank[root_i] < rank[root_j]) 
+            std::swap(root_i, root_j);
+        
+        parent[root_j] = root_i;
+
+        bool bumped = rank[root_i] == rank[root_j];
+        if (bumped) 
+            rank[root_i]++;
+
+        log.push_back({root_j, bumped});
+    }
+}
+
+inline bool RollbackDSU::connected(int i, int j) const {
+    return find(i) == find(j);
+}
+
+inline int RollbackDSU::checkpoint() const {
+    return static_cast<int>(log.size());
+}
+
+inline void RollbackDSU::rollback(int checkpoint) {
+    while (static_cast<int>(log.size()) > checkpoint) {
+        const Union& u = log.back();
+        int root = parent[u.child];
+
+        if (u.bumped) 
+            rank[root]--;
+
+        parent[u.child] = u.child;
+        log.pop_back();
+    }
+}
+
+inline void RollbackDSU::set_state(std::vector<int> parents, std::vector<int> ranks, std::vector<Union> unions) {
+    parent = std::move(parents);
+    rank = std::move(ranks);
+    log = std::move(unions);
+}
+
+#endif // ROLLBACK_DSU_HPP
@@ -1,26 +1,55 @@
 #include "HexAI.hpp"
+#include "FixedHexBoard.hpp"
+#include "LeanHexBoard.hpp"
+#include "PatternTable.hpp"
+#include "PatternSampler.hpp"
 
 #include <cmath>
+#include <cassert>
+#include <mutex>
+#include <cstdint>
+#include <atomic>
+#include <memory>
 #include <vector>
 #include <chrono>
+#include <array>
 #include <cstring>
+#include <fstream>
+#include <numeric>
 #include <algorithm>
 #include <random>
+#include <thread>
+#include <functional>
+#include <condition_variable>
 
-namespace {
+#if defined(_MSC_VER)
+#include <intrin.h>
+#endif
 
-    namespace HeuristicWeights {
-        constexpr int BRIDGE_BUILD  = 5'000;
-        constexpr int CENTER_BIAS   = 100;
-        constexpr int DIST_PENALTY  = 10;
-    }
+#ifndef HEX_PROFILING
+#define HEX_PROFILING 1
+#endif
+
+namespace {
 
     namespace MCTSParams {
-        constexpr double UCT_EXPLORATION = 0.2;
+        constexpr int TIME_LIMITS[]      = {500, 900, 1'000};
         constexpr double RAVE_BIAS_HARD  = 3'000.0;
         constexpr double RAVE_BIAS_OTHER = 500.0;
-        constexpr int TIME_LIMITS[]      = {500, 900, 1'000};
-        constexpr int NODE_POOL_SIZE     = 200'000;
+
+        // Smallest tree worth searching with
+        constexpr int MIN_NODE_POOL = 1'024;
+
+        // Default node budget per board cell (about 200k nodes on 11x11), capped for very large boards
+        constexpr int NODES_PER_CELL = 1'650;
+        constexpr int MAX_NODE_POOL  = 2'000'000;
+    }
+
+    // Game-theoretic node values, from player_who_moved's view
+    namespace Solver {
+        constexpr int8_t UNKNOWN = 0;
+        constexpr int8_t WIN     = 1;
+        constexpr int8_t LOSS    = -1;
     }
 
     struct MCTSNode {
@@ -35,7 +64,19 @@ namespace {
         double rave_wins = 0.0;
 
         std::vector<int> children;
-        std::vector<int> untried;
+
+        // Lazy expansion: a cursor walks the static move order twice,
+        // bridge moves on the first pass and everything else on the second
+        int untried_left = 0;
+        int order_cursor = 0;
+        bool bridge_pass = true;
+
+        // With priors the untried moves are ranked once, on first expansion,
+        // and kept as a max-heap of (prior, move)
+        float prior = 0.5f;
+        int8_t proven = Solver::UNKNOWN;
+        bool ranked_ready = false;
+        std::vector<std::pair<float, int>> ranked;
 
         MCTSNode(int m, int p, int pl) 
             : move_idx(m), parent_idx(p), player_who_moved(pl) {
@@ -43,6 +84,82 @@ namespace {
             }
     };
 
+    // Static per-board-size expansion order and bridge geometry
+    struct MoveOrderTable {
+        static constexpr int MAX_BRIDGES = 6;
+
+        int rows = 0, cols = 0;
+
+        // Cells by ascending distance to the center
+        std::vector<int> order;
+
+        // 1 at the center, 0 at the farthest corner
+        std::vector<float> centrality;
+
+        // Cells forming a bridge with each cell, -1 padded
+        std::vector<std::array<int, MAX_BRIDGES>> bridges;
+
+        void ensure(const HexBoard& board) {
+            if (board.rows == rows && board.cols == cols) 
+                return;
+
+            rows = board.rows;
+            cols = board.cols;
+            const int N = rows * cols;
+            const int center_r = rows / 2;
+            const int center_c = cols / 2;
+
+            // Center Bias (Manhattan approximation)
+            std::vector<int> dist(N);
+            for (int i = 0; i < N; ++i) 
+                dist[i] = std::abs(i / cols - center_r) + std::abs(i % cols - center_c);
+
+            order.resize(N);
+            std::iota(order.begin(), order.end(), 0);
+            std::stable_sort(order.begin(), order.end(), [&](int a, int b) {
+                return dist[a] < dist[b];
+            });
+
+            const int max_dist = std::max(1, dist[order.back()]);
+            centrality.resize(N);
+            for (int i = 0; i < N; ++i) 
+                centrality[i] = 1.0f - static_cast<float>(dist[i]) / max_dist;
+
+            // Bridge = two non-adjacent cells sharing exactly two neighbours
+            bridges.assign(N, {});
+            std::vector<int> common(N, 0);
+            std::vector<int> touched;
+
+            for (int a = 0; a < N; ++a) {
+                const auto& adjacent = board.get_neighbors(a);
+                bridges[a].fill(-1);
+                touched.clear();
+
+                for (int n : adjacent) {
+                    if (n >= N) 
+                        continue;
+
+                    for (int b : board.get_neighbors(n)) {
+                        if (b < N && b != a) {
+                            common[b]++;
+                            touched.push_back(b);
+                        }
+                    }
+                }
+
+                int count = 0;
+                for (int b : touched) {
+                    bool is_adjacent = std::find(adjacent.begin(), adjacent.end(), b) != adjacent.end();
+
+                    if (common[b] == 2 && !is_adjacent && count < MAX_BRIDGES) 
+                        bridges[a][count++] = b;
+
+                    common[b] = 0;
+                }
+            }
+        }
+    };
+
     // Thread Local Storage 
     
     struct ThreadLocalContext {
@@ -56,25 +173,50 @@ namespace {
         std::vector<int> sim_move_pos;
         std::vector<int> p1_moves;
         std::vector<int> p2_moves;
-        std::vector<bool> rave_lookup;
+        std::vector<int> rave_count[2];     // AMAF hits per move by winner colour
+        PatternSampler sampler;
+        MoveOrderTable move_order;
+        std::vector<int> dist_maps[4];
+
+        // Per-node bitmask of the moves that have a child, mask_words words per node.
+        // Children are kept sorted by move, so a bit's rank is the child's position
+        int mask_words = 0;
+        std::vector<uint64_t> child_masks;
+        std::vector<uint64_t> hit_mask;     // Moves with AMAF hits in the current backup
+
+        void reset_tree(int pool_size, int N) {
+            m_nodes.clear();
+            child_masks.clear();
+            mask_words = (N + 63) / 64;
+            hit_mask.assign(mask_words, 0);
+
+            if (m_nodes.capacity() < static_cast<size_t>(pool_size)) 
+                m_nodes.reserve(pool_size);
 
-        ThreadLocalContext() {
-            m_nodes.reserve(MCTSParams::NODE_POOL_SIZE);
-            sim_moves.reserve(400);
-            sim_move_pos.resize(400, -1);
-            p1_moves.reserve(200);
-            p2_moves.reserve(200);
-            rave_lookup.resize(400, false);
+            if (child_masks.capacity() < static_cast<size_t>(pool_size) * mask_words) 
+                child_masks.reserve(static_cast<size_t>(pool_size) * mask_words);
         }
 
-        void reset_tree() {
-            m_nodes.clear();
+        int new_node(int move, int parent, int player) {
+            m_nodes.emplace_back(move, parent, player);
+            child_masks.resize(child_masks.size() + mask_words, 0);
+
+            return static_cast<int>(m_nodes.size()) - 1;
+        }
+
+        uint64_t* child_mask(int node_idx) {
+            return child_masks.data() + static_cast<size_t>(node_idx) * mask_words;
         }
 
+        // Simulation buffers grow with the largest board seen on this thread
         void ensure_buffer_size(int N) {
             if (sim_move_pos.size() < static_cast<size_t>(N)) {
+                sim_moves.reserve(N);
                 sim_move_pos.resize(N, -1);
-                rave_lookup.resize(N, false);
+                p1_moves.reserve(N / 2 + 1);
+                p2_moves.reserve(N / 2 + 1);
+                rave_count[0].resize(N, 0);
+                rave_count[1].resize(N, 0);
             }
         }
     };
@@ -86,31 +228,215 @@ namespace {
             return (player == PLAYER_1) ? PLAYER_2 : PLAYER_1; 
         }
 
+        inline int popcount(uint64_t x) {
+#if defined(_MSC_VER)
+            return static_cast<int>(__popcnt64(x));
+#else
+            return __builtin_popcountll(x);
+#endif
+        }
+
+        // Index of the lowest set bit, x must be non-zero
+        inline int lowest_bit(uint64_t x) {
+#if defined(_MSC_VER)
+            unsigned long idx;
+            _BitScanForward64(&idx, x);
+            return static_cast<int>(idx);
+#else
+            return __builtin_ctzll(x);
+#endif
+        }
+
         inline int rand_index(int limit) {
             std::uniform_int_distribution<int> dist(0, limit - 1);
             return dist(ctx.rng);
         }
     }
 
+    namespace Profiling {
+        using Clock = std::chrono::steady_clock;
+
+        enum Phase { 
+            SELECTION, EXPANSION, SIMULATION, BACKPROPAGATION, PHASE_COUNT 
+        };
+
+        constexpr const char* PHASE_NAMES[PHASE_COUNT] = {
+            "selection", "expansion", "simulation", "backpropagation"
+        };
+
+        // Caps trace memory, a 1s search easily runs >100k iterations
+        constexpr size_t TRACE_EVENT_LIMIT = 200'000;
+
+        struct TraceEvent {
+            Phase phase;
+            Clock::time_point start;
+            Clock::time_point end;
+        };
+
+        std::atomic<bool> g_enabled{false};
+
+        std::mutex g_mutex;
+        std::string g_trace_path;
+        SearchStats g_last_stats;
+
+        inline double to_ms(Clock::duration d) {
+            return std::chrono::duration<double, std::milli>(d).count();
+        }
+
+        inline double to_us(Clock::duration d) {
+            return std::chrono::duration<double, std::micro>(d).count();
+        }
+
+        void write_trace(const std::string& path, const std::vector<TraceEvent>& events, 
+                         Clock::time_point origin, Clock::time_point finish) {
+            std::ofstream out(path);
+            if (!out) 
+                return;
+
+            // Chrome trace-event format, "X" = complete event (ts/dur in microseconds)
+            out << "{\"traceEvents\":[\n";
+            out << "{\"name\":\"search\",\"cat\":\"mcts\",\"ph\":\"X\",\"pid\":1,\"tid\":1,"
+                << "\"ts\":0,\"dur\":" << to_us(finish - origin) << "}";
+
+            for (const auto& e : events) {
+                out << ",\n{\"name\":\"" << PHASE_NAMES[e.phase] << "\",\"cat\":\"mcts\",\"ph\":\"X\",\"pid\":1,\"tid\":1,"
+                    << "\"ts\":" << to_us(e.start - origin) << ",\"dur\":" << to_us(e.end - e.start) << "}";
+            }
+
+            out << "\n],\"displayTimeUnit\":\"ms\"}\n";
+        }
+
+        // Per-search recorder, all calls are no-ops unless profiling is on
+        class Recorder {
+            bool m_active = false;
+            bool m_tracing = false;
+            std::string m_trace_path;
+
+            Clock::duration m_totals[PHASE_COUNT] = {};
+            std::vector<TraceEvent> m_events;
+
+        public:
+            Recorder() {
+#if HEX_PROFILING
+                m_active = g_enabled.load(std::memory_order_relaxed);
+
+                if (m_active) {
+                    std::lock_guard<std::mutex> lock(g_mutex);
+                    m_trace_path = g_trace_path;
+                    m_tracing = !m_trace_path.empty();
+                }
+#endif
+            }
+
+            bool active() const { 
+                return m_active; 
+            }
+
+            Clock::time_point begin() const {
+                return m_active ? Clock::now() : Clock::time_point{};
+            }
+
+            void end(Phase phase, Clock::time_point start) {
+                if (!m_active) 
+                    return;
+
+                auto now = Clock::now();
+                m_totals[phase] += now - start;
+
+                if (m_tracing && m_events.size() < TRACE_EVENT_LIMIT) 
+                    m_events.push_back({phase, start, now});
+            }
+
+            void finish(SearchStats& stats, Clock::time_point origin, Clock::time_point finish) const {
+                stats.profiled = m_active;
+                if (!m_active) 
+                    return;
+
+                stats.selection_ms       = to_ms(m_totals[SELECTION]);
+                stats.expansion_ms       = to_ms(m_totals[EXPANSION]);
+                stats.simulation_ms      = to_ms(m_totals[SIMULATION]);
+                stats.backpropagation_ms = to_ms(m_totals[BACKPROPAGATION]);
+
+                if (m_tracing) 
+                    write_trace(m_trace_path, m_events, origin, finish);
+            }
+        };
+
+        void publish(const SearchStats& stats) {
+            std::lock_guard<std::mutex> lock(g_mutex);
+            g_last_stats = stats;
+        }
+    }
+
+    namespace Patterns {
+        // Replaced atomically, a running search keeps the table it started with
+        std::shared_ptr<const PatternTable> g_table = std::make_shared<const PatternTable>();
+
+        std::shared_ptr<const PatternTable> current() {
+            return std::atomic_load(&g_table);
+        }
+
+        void install(std::shared_ptr<const PatternTable> table) {
+            std::atomic_store(&g_table, std::move(table));
+        }
+    }
+
+    namespace Analysis {
+        constexpr int PV_MAX_LENGTH = 12;
+
+        std::atomic<int> g_interval_ms{100};
+        // Bumped by stop(); a search runs while it still matches the value it started with
+        std::atomic<uint64_t> g_stop_generation{0};
+
+        std::mutex g_mutex;
+        AnalysisSnapshot g_snapshot;
+
+        // Swaps the snapshot into the shared buffer. Periodic updates use try_lock,
+        // so a reader holding the buffer only delays the update, never the search
+        void publish(AnalysisSnapshot& snapshot, bool force) {
+            if (force) {
+                std::lock_guard<std::mutex> lock(g_mutex);
+                std::swap(g_snapshot, snapshot);
+                return;
+            }
+
+            std::unique_lock<std::mutex> lock(g_mutex, std::try_to_lock);
+            if (lock.owns_lock()) 
+                std::swap(g_snapshot, snapshot);
+        }
+
+        void publish_forced(int ply, int player, int move, double win_rate, uint64_t token) {
+            AnalysisSnapshot snapshot;
+            snapshot.ply = ply;
+            snapshot.player = player;
+            snapshot.token = token;
+            snapshot.value = win_rate;
+            snapshot.moves = {move};
+            snapshot.visits = {0};
+            snapshot.win_rates = {win_rate};
+            snapshot.pv = {move};
+
+            publish(snapshot, true);
+        }
+    }
+
     namespace Heuristics {
         
-        inline bool is_bridge_move(int r, int c, const HexBoard& board, int player) {
-            static const int BRIDGE_OFFSETS[6][2] = {
-                {-1, -1}, {-1, 2}, {1, -2}, {1, 1}, {-2, 1}, {2, -1}
-            };
-
-            for (const auto& off : BRIDGE_OFFSETS) {
-                int tr = r + off[0]; 
-                int tc = c + off[1];
+        template <class Board>
+        inline bool is_bridge_move(int idx, const Board& board, int player) {
+            for (int partner : ctx.move_order.bridges[idx]) {
+                if (partner == -1) 
+                    break;
 
-                if (board.is_valid(tr, tc) && board.get_cell(tr, tc) == player) 
+                if (board.get_cell_by_index(partner) == player) 
                     return true;
             }
 
             return false;
         }
 
-        inline int find_common_empty_neighbor(const HexBoard& board, int u, int v, int exclude_idx) {
+        template <class Board>
+        inline int find_common_empty_neighbor(const Board& board, int u, int v, int exclude_idx) {
             const auto& nu = board.get_neighbors(u);
             const auto& nv = board.get_neighbors(v);
             const int N = board.rows * board.cols;
@@ -129,7 +455,8 @@ namespace {
             return -1;
         }
 
-        inline int get_bridge_save_move(const HexBoard& board, int last_move_idx, int player_defending) {
+        template <class Board>
+        inline int get_bridge_save_move(const Board& board, int last_move_idx, int player_defending) {
             if (last_move_idx == -1) 
                 return -1;
             
@@ -160,77 +487,212 @@ namespace {
 
             return -1;
         }
+    }
+
+    // Playouts run from one leaf: wins per player and, per playout, the
+    // winner's moves for the RAVE update
+    struct LeafBatch {
+        int playouts = 0;
+        int wins[3] = {0, 0, 0};
+        std::vector<int> moves[3];
+        long long playout_moves = 0;
+
+        void clear() {
+            playouts = 0;
+            playout_moves = 0;
+
+            for (int p = 0; p < 3; ++p) {
+                wins[p] = 0;
+                moves[p].clear();
+            }
+        }
 
-        void sort_untried_moves(std::vector<int>& moves, const HexBoard& board, int player) {
-            if (moves.empty()) 
-                return;
+        void add(int winner, const std::vector<int>& winning_moves, size_t length) {
+            playouts++;
+            wins[winner]++;
+            moves[winner].insert(moves[winner].end(), winning_moves.begin(), winning_moves.end());
+            playout_moves += length;
+        }
+
+        void merge(const LeafBatch& other) {
+            playouts += other.playouts;
+            playout_moves += other.playout_moves;
+
+            for (int p = 0; p < 3; ++p) {
+                wins[p] += other.wins[p];
+                moves[p].insert(moves[p].end(), other.moves[p].begin(), other.moves[p].end());
+            }
+        }
+    };
 
-            // Reuse static buffer to avoid allocation
-            static thread_local std::vector<std::pair<int, int>> sort_buffer;
-            sort_buffer.clear();
-            if(sort_buffer.capacity() < moves.size()) sort_buffer.reserve(moves.size());
+    // Helper threads running one job at a time alongside the calling thread.
+    // Each helper has its own thread-local context
+    class WorkerPool {
+        std::vector<std::thread> m_threads;
+        std::mutex m_mutex;
+        std::condition_variable m_start;
+        std::condition_variable m_done;
 
-            const int center_r = board.rows / 2;
-            const int center_c = board.cols / 2;
+        const std::function<void(int)>* m_job = nullptr;
+        long long m_generation = 0;
+        int m_pending = 0;
+        bool m_quit = false;
 
-            for (int m : moves) {
-                int score = 0;
-                auto [r, c] = board.get_coord(m);
+    public:
+        explicit WorkerPool(int helpers) {
+            for (int id = 1; id <= helpers; ++id) 
+                m_threads.emplace_back(&WorkerPool::loop, this, id);
+        }
 
-                // Center Bias (Manhattan approximation)
-                int dist = std::abs(r - center_r) + std::abs(c - center_c);
-                score += (HeuristicWeights::CENTER_BIAS - dist * HeuristicWeights::DIST_PENALTY);
+        ~WorkerPool() {
+            {
+                std::lock_guard<std::mutex> lock(m_mutex);
+                m_quit = true;
+            }
+
+            m_start.notify_all();
+            for (auto& t : m_threads) 
+                t.join();
+        }
 
-                if (is_bridge_move(r, c, board, player)) 
-                    score += HeuristicWeights::BRIDGE_BUILD;
+        int lanes() const { 
+            return static_cast<int>(m_threads.size()) + 1; 
+        }
 
-                sort_buffer.push_back({score, m});
+        // job(0) runs on the caller, job(1..) on the helpers; returns once all finished
+        void run(const std::function<void(int)>& job) {
+            {
+                std::lock_guard<std::mutex> lock(m_mutex);
+                m_job = &job;
+                m_pending = static_cast<int>(m_threads.size());
+                m_generation++;
             }
 
-            // Sort: Ascending score means highest scores are at the back (efficient for pop_back)
-            std::sort(sort_buffer.begin(), sort_buffer.end(), [](const auto& a, const auto& b) {
-                return a.first < b.first; 
-            });
+            m_start.notify_all();
+            job(0);
 
-            for(size_t i = 0; i < moves.size(); ++i) 
-                moves[i] = sort_buffer[i].second;
+            std::unique_lock<std::mutex> lock(m_mutex);
+            m_done.wait(lock, [&] { return m_pending == 0; });
+            m_job = nullptr;
         }
-    }
 
+    private:
+        void loop(int id) {
+            long long seen = 0;
+
+            while (true) {
+                const std::function<void(int)>* job;
+                {
+                    std::unique_lock<std::mutex> lock(m_mutex);
+                    m_start.wait(lock, [&] { return m_quit || m_generation != seen; });
+
+                    if (m_quit) 
+                        return;
+
+                    seen = m_generation;
+                    job = m_job;
+                }
+
+                (*job)(id);
+
+                {
+                    std::lock_guard<std::mutex> lock(m_mutex);
+                    m_pending--;
+                }
+
+                m_done.notify_one();
+            }
+        }
+    };
+
+    // Board is LeanHexBoard or one of the FixedHexBoard specializations
+    template <class Board>
     class MCTS {
-        double m_rave_bias;
+        SearchConfig m_cfg;
+        uint64_t m_stop_token;      // Stop generation this search started from
+        int m_root_player;
+        int m_root_empty;
+        int m_ply;
+
+        AnalysisSnapshot m_snapshot;
+
+        // Null when the table is uniform, playouts then skip the sampler
+        std::shared_ptr<const PatternTable> m_patterns;
+
+        Profiling::Recorder m_recorder;
+        SearchStats m_stats;
+        long long m_depth_total = 0;
+        long long m_playout_moves = 0;
+        long long m_playouts = 0;
+
+        // Leaf batches, one per lane; the pool only exists with leaf_threads > 0
+        std::unique_ptr<WorkerPool> m_pool;
+        std::vector<LeafBatch> m_batches;
 
     public:
-        MCTS(const HexBoard& root_board, int root_player, Difficulty diff) {
+        MCTS(const HexBoard& root_board, int root_player, const SearchConfig& cfg, uint64_t stop_token) 
+            : m_cfg(cfg), m_stop_token(stop_token) {
+            const int N = root_board.rows * root_board.cols;
+
+            if (m_cfg.node_pool_size <= 0) 
+                m_cfg.node_pool_size = static_cast<int>(std::min<long long>(
+                    static_cast<long long>(N) * MCTSParams::NODES_PER_CELL, MCTSParams::MAX_NODE_POOL));
+
+            m_cfg.node_pool_size = std::max(m_cfg.node_pool_size, MCTSParams::MIN_NODE_POOL);
+
             // Reset the global thread-local tree
-            ctx.reset_tree();
+            ctx.reset_tree(m_cfg.node_pool_size, N);
             
-            // Configure RAVE
-            m_rave_bias = (diff == Difficulty::HARD) ? MCTSParams::RAVE_BIAS_HARD : MCTSParams::RAVE_BIAS_OTHER;
+            m_root_player = root_player;
+
+            m_patterns = Patterns::current();
+            if (m_patterns->is_uniform()) 
+                m_patterns.reset();
+            else 
+                ctx.sampler.prepare_root(root_board, m_patterns.get());
 
             // Create Root Node
             int opponent = Utility::toggle_player(root_player);
             // Emplace back into the ctx.nodes vector
-            ctx.m_nodes.emplace_back(-1, -1, opponent);
+            ctx.new_node(-1, -1, opponent);
 
             // Init Root Moves
+            ctx.move_order.ensure(root_board);
+
             MCTSNode& root = ctx.m_nodes[0];
-            root.untried = root_board.get_legal_moves();
 
-            Heuristics::sort_untried_moves(root.untried, root_board, root_player);
+            for (int i = 0; i < N; ++i) 
+                if (root_board.get_cell_by_index(i) == EMPTY) 
+                    root.untried_left++;
+
+            m_root_empty = root.untried_left;
+            m_ply = N - m_root_empty;
         }
 
-        int run(HexBoard root_board, int time_limit_ms);
+        int run(const Board& root_board);
+
+        const SearchStats& stats() const { 
+            return m_stats; 
+        }
 
     private:
         int select_child(int node_idx) const; 
-        int expand(int node_idx, HexBoard& board); 
-        std::pair<int, const std::vector<int>&> simulate(HexBoard board, int current_player); 
-        void backpropagate(int leaf_idx, int winner, const std::vector<int>& winning_moves); 
+        void rank_moves(MCTSNode& node, const Board& board) const;
+        int next_untried(MCTSNode& node, const Board& board, float& prior) const;
+        int expand(int node_idx, Board& board, int child_depth); 
+        std::pair<int, const std::vector<int>&> simulate(Board board, int current_player) const; 
+        const LeafBatch& run_playouts(const Board& leaf, int current_player);
+        void start_workers(const Board& root_board);
+        void backpropagate(int leaf_idx, const LeafBatch& batch); 
         int get_best_move() const;
+        int proven_winner(int node_idx) const;
+        bool try_prove(int node_idx);
+        void finish_stats(int iterations, Profiling::Clock::time_point start_time);
+        void fill_snapshot(int iterations, bool searching);
     };
 
-    int MCTS::select_child(int node_idx) const {
+    template <class Board>
+    int MCTS<Board>::select_child(int node_idx) const {
         const auto& node = ctx.m_nodes[node_idx];
         double best_score = -1e9;
         int best_child = -1;
@@ -240,6 +702,10 @@ namespace {
 
         for (int child_idx : node.children) {
             const auto& child = ctx.m_nodes[child_idx];
+
+            // Proven losing replies never need another look
+            if (child.proven == Solver::LOSS) 
+                continue;
             
             double v  = child.visits + 1e-9;
             double rv = child.rave_visits + 1e-9;
@@ -248,15 +714,19 @@ namespace {
             double rw = child.rave_wins / rv;
 
             // RAVE Beta
-            double beta = rv / (rv + v + m_rave_bias * v * w);
+            double beta = rv / (rv + v + m_cfg.rave_bias * v * w);
             if (child.visits == 0) 
                 beta = 1.0;
             
             double q_rave = (1.0 - beta) * w + beta * rw;
 
-            double explore = MCTSParams::UCT_EXPLORATION * std::sqrt(log_visits / v);
+            double explore = m_cfg.uct_exploration * std::sqrt(log_visits / v);
             double score   = q_rave + explore;
 
+            // Progressive bias fades as real visits accumulate
+            if (m_cfg.use_priors) 
+                score += m_cfg.progressive_bias * child.prior / (child.visits - m_cfg.prior_visits + 1);
+
             if (score > best_score) {
                 best_score = score;
                 best_child = child_idx;
@@ -266,35 +736,153 @@ namespace {
         return best_child;
     }
 
-    int MCTS::expand(int node_idx, HexBoard& board) {
-        int move = ctx.m_nodes[node_idx].untried.back();
-        ctx.m_nodes[node_idx].untried.pop_back();
+    template <class Board>
+    void MCTS<Board>::rank_moves(MCTSNode& node, const Board& board) const {
+        const auto& order = ctx.move_order.order;
+        const int N = static_cast<int>(order.size());
+        const int player = Utility::toggle_player(node.player_who_moved);
+        const int opponent = node.player_who_moved;
+        auto& d = ctx.dist_maps;
+
+        // A move shortens a shortest path iff it lies on one: forward + backward - itself == total
+        int own_dist = board.get_distance_map(player, false, d[0]);
+        board.get_distance_map(player, true, d[1]);
+        int opp_dist = board.get_distance_map(opponent, false, d[2]);
+        board.get_distance_map(opponent, true, d[3]);
+
+        double mean_pattern = 0.0;
+        if (m_patterns) {
+            for (int m = 0; m < N; ++m) 
+                if (board.get_cell_by_index(m) == EMPTY) 
+                    mean_pattern += m_patterns->get_weight(player, PatternTable::encode(board, ctx.sampler.slots[m]));
+
+            mean_pattern /= std::max(1, node.untried_left);
+        }
+
+        node.ranked.clear();
+        node.ranked.reserve(node.untried_left);
+
+        // Walking the static order lets the rank break ties by center bias
+        for (int rank = 0; rank < N; ++rank) {
+            int m = order[rank];
+            if (board.get_cell_by_index(m) != EMPTY) 
+                continue;
+
+            double prior = 0.5;
+
+            if (own_dist < 9999 && d[0][m] + d[1][m] - 1 == own_dist) 
+                prior += m_cfg.prior_own_path;
+
+            if (opp_dist < 9999 && d[2][m] + d[3][m] - 1 == opp_dist) 
+                prior += m_cfg.prior_opp_path;
+
+            if (Heuristics::is_bridge_move(m, board, player)) 
+                prior += m_cfg.prior_bridge;
+
+            prior += m_cfg.prior_center * ctx.move_order.centrality[m];
+
+            if (m_patterns && mean_pattern > 0.0) {
+                double ratio = m_patterns->get_weight(player, PatternTable::encode(board, ctx.sampler.slots[m])) / mean_pattern;
+                prior += m_cfg.prior_pattern * (ratio - 1.0) / (ratio + 1.0);
+            }
+
+            prior = std::clamp(prior, 0.05, 0.95) - rank * 1e-6;
+            node.ranked.push_back({static_cast<float>(prior), m});
+        }
+
+        std::make_heap(node.ranked.begin(), node.ranked.end());
+        node.ranked_ready = true;
+    }
+
+    template <class Board>
+    int MCTS<Board>::next_untried(MCTSNode& node, const Board& board, float& prior) const {
+        if (m_cfg.use_priors) {
+            if (!node.ranked_ready) 
+                rank_moves(node, board);
+
+            std::pop_heap(node.ranked.begin(), node.ranked.end());
+            auto [p, m] = node.ranked.back();
+            node.ranked.pop_back();
+
+            // Fully expanded, give the memory back
+            if (node.ranked.empty()) 
+                std::vector<std::pair<float, int>>().swap(node.ranked);
+
+            prior = p;
+            return m;
+        }
+
+        const auto& order = ctx.move_order.order;
+        const int N = static_cast<int>(order.size());
+        const int player = Utility::toggle_player(node.player_who_moved);
+
+        // The board is the node's position on every visit, so each pass
+        // sees the same bridge set and the cursor never needs to go back
+        if (node.bridge_pass) {
+            while (node.order_cursor < N) {
+                int m = order[node.order_cursor++];
+
+                if (board.get_cell_by_index(m) == EMPTY && Heuristics::is_bridge_move(m, board, player)) 
+                    return m;
+            }
+
+            node.bridge_pass = false;
+            node.order_cursor = 0;
+        }
+
+        while (node.order_cursor < N) {
+            int m = order[node.order_cursor++];
+
+            if (board.get_cell_by_index(m) == EMPTY && !Heuristics::is_bridge_move(m, board, player)) 
+                return m;
+        }
+
+        return -1;
+    }
+
+    template <class Board>
+    int MCTS<Board>::expand(int node_idx, Board& board, int child_depth) {
+        float prior = 0.5f;
+        int move = next_untried(ctx.m_nodes[node_idx], board, prior);
+        ctx.m_nodes[node_idx].untried_left--;
 
         int player     = ctx.m_nodes[node_idx].player_who_moved;
         int next_player = Utility::toggle_player(player);
         
         // Add new node to the pool
-        ctx.m_nodes.emplace_back(move, node_idx, next_player);
-        int child_idx = (int)ctx.m_nodes.size() - 1;
+        int child_idx = ctx.new_node(move, node_idx, next_player);
         
-        // Safely link parent to child using index
-        ctx.m_nodes[node_idx].children.push_back(child_idx);
+        // Link parent to child by index, keeping children sorted by move
+        auto& children = ctx.m_nodes[node_idx].children;
+        auto pos = std::lower_bound(children.begin(), children.end(), move, [](int c_idx, int m) {
+            return ctx.m_nodes[c_idx].move_idx < m;
+        });
+
+        children.insert(pos, child_idx);
+        ctx.child_mask(node_idx)[move >> 6] |= uint64_t{1} << (move & 63);
+
+        if (m_cfg.use_priors) {
+            auto& child = ctx.m_nodes[child_idx];
+            child.prior  = prior;
+            child.visits = m_cfg.prior_visits;
+            child.wins   = m_cfg.prior_visits * prior;
+        }
 
         // Update Board
         auto [r, c] = board.get_coord(move);
         board.make_move(r, c, next_player);
 
-        // If not terminal, generate moves for the child
-        if (board.check_win() == EMPTY) {
-            auto& child = ctx.m_nodes[child_idx];
-            child.untried = board.get_legal_moves();
-            Heuristics::sort_untried_moves(child.untried, board, Utility::toggle_player(next_player));
-        }
+        // Terminal nodes have nothing left to expand, only the mover can complete a chain
+        if (board.check_win() == EMPTY) 
+            ctx.m_nodes[child_idx].untried_left = m_root_empty - child_depth;
+        else if (m_cfg.use_solver) 
+            ctx.m_nodes[child_idx].proven = Solver::WIN;
 
         return child_idx;
     }
 
-    std::pair<int, const std::vector<int>&> MCTS::simulate(HexBoard board, int current_player) {
+    template <class Board>
+    std::pair<int, const std::vector<int>&> MCTS<Board>::simulate(Board board, int current_player) const {
         // Clear reuse buffers
         ctx.p1_moves.clear(); 
         ctx.p2_moves.clear(); 
@@ -315,6 +903,10 @@ namespace {
             }
         }
 
+        PatternSampler* sampler = m_patterns ? &ctx.sampler : nullptr;
+        if (sampler) 
+            sampler->reset(board);
+
         int winner = board.check_win();
         int last_move = -1; 
 
@@ -329,11 +921,15 @@ namespace {
                     selected = save;
             }
 
-            // 2. Random Selection
+            // 2. Pattern-weighted Selection
+            if (selected == -1 && sampler) 
+                selected = sampler->sample(current_player, ctx.rng);
+
+            // 3. Random Selection
             if (selected == -1) 
                 selected = ctx.sim_moves[Utility::rand_index(ctx.sim_moves.size())];
 
-            // 3. Fast Removal (Swap & Pop)
+            // 4. Fast Removal (Swap & Pop)
             int idx_in_vec = ctx.sim_move_pos[selected];
             int last_val   = ctx.sim_moves.back();
 
@@ -343,9 +939,12 @@ namespace {
             ctx.sim_moves.pop_back();
             ctx.sim_move_pos[selected] = -1; // Mark as taken
 
-            // 4. Apply Move
+            // 5. Apply Move
             auto [r, c] = board.get_coord(selected);
             board.make_move(r, c, current_player);
+
+            if (sampler) 
+                sampler->place(selected, current_player);
             
             if (current_player == PLAYER_1) 
                 ctx.p1_moves.push_back(selected);
@@ -360,119 +959,422 @@ namespace {
         return {winner, (winner == PLAYER_1 ? ctx.p1_moves : ctx.p2_moves)};
     }
 
-    void MCTS::backpropagate(int leaf_idx, int winner, const std::vector<int>& winning_moves) {
-        std::fill(ctx.rave_lookup.begin(), ctx.rave_lookup.end(), false);
-        for (int m : winning_moves) 
-            ctx.rave_lookup[m] = true;
+    template <class Board>
+    int MCTS<Board>::proven_winner(int node_idx) const {
+        const auto& node = ctx.m_nodes[node_idx];
+
+        if (node.proven == Solver::WIN) 
+            return node.player_who_moved;
+
+        if (node.proven == Solver::LOSS) 
+            return Utility::toggle_player(node.player_who_moved);
+
+        return EMPTY;
+    }
+
+    template <class Board>
+    bool MCTS<Board>::try_prove(int node_idx) {
+        auto& node = ctx.m_nodes[node_idx];
+        if (node.proven != Solver::UNKNOWN) 
+            return false;
+
+        // One winning reply is enough for the player to move
+        bool all_lost = true;
+        for (int c_idx : node.children) {
+            int8_t proof = ctx.m_nodes[c_idx].proven;
+
+            if (proof == Solver::WIN) {
+                node.proven = Solver::LOSS;
+                return true;
+            }
+
+            all_lost &= (proof == Solver::LOSS);
+        }
+
+        // Every reply loses, but only once all of them exist
+        if (all_lost && node.untried_left == 0 && !node.children.empty()) {
+            node.proven = Solver::WIN;
+            return true;
+        }
+
+        return false;
+    }
+
+    template <class Board>
+    void MCTS<Board>::start_workers(const Board& root_board) {
+        const int helpers = std::min(m_cfg.leaf_threads, m_cfg.leaf_playouts - 1);
+
+        if (helpers > 0) {
+            m_pool = std::make_unique<WorkerPool>(helpers);
+
+            // Helper contexts need the playout buffers and the root patterns
+            m_pool->run([&](int lane) {
+                if (lane == 0) 
+                    return;
+
+                ctx.ensure_buffer_size(root_board.rows * root_board.cols);
+                if (m_patterns) 
+                    ctx.sampler.prepare_root(root_board, m_patterns.get());
+            });
+        }
+
+        m_batches.resize(m_pool ? m_pool->lanes() : 1);
+    }
+
+    template <class Board>
+    const LeafBatch& MCTS<Board>::run_playouts(const Board& leaf, int current_player) {
+        const int count = std::max(1, m_cfg.leaf_playouts);
+        const int lanes = static_cast<int>(m_batches.size());
+
+        // Lanes take every lanes-th playout, simulate only touches the calling thread's context
+        auto job = [&](int lane) {
+            LeafBatch& batch = m_batches[lane];
+            batch.clear();
+
+            for (int i = lane; i < count; i += lanes) {
+                auto [winner, moves] = simulate(leaf, current_player);
+                batch.add(winner, moves, ctx.p1_moves.size() + ctx.p2_moves.size());
+            }
+        };
+
+        if (m_pool) 
+            m_pool->run(job);
+        else 
+            job(0);
+
+        for (int lane = 1; lane < lanes; ++lane) 
+            m_batches[0].merge(m_batches[lane]);
+
+        return m_batches[0];
+    }
+
+    template <class Board>
+    void MCTS<Board>::backpropagate(int leaf_idx, const LeafBatch& batch) {
+        const int words = ctx.mask_words;
+        uint64_t* hits = ctx.hit_mask.data();
+
+        // AMAF hits per move, cleared again through the same move lists
+        for (int p = 0; p < 2; ++p) {
+            for (int m : batch.moves[p + 1]) {
+                ctx.rave_count[p][m]++;
+                hits[m >> 6] |= uint64_t{1} << (m & 63);
+            }
+        }
+
+        // A new proof travels up only while it keeps proving parents
+        bool proving = ctx.m_nodes[leaf_idx].proven != Solver::UNKNOWN;
 
         int node_idx = leaf_idx;
         while (node_idx != -1) {
             MCTSNode& node = ctx.m_nodes[node_idx];
-            node.visits++;
-            
-            if (node.player_who_moved == winner) 
-                node.wins += 1.0;
+            node.visits += batch.playouts;
+            node.wins += batch.wins[node.player_who_moved];
 
             // RAVE Update
-            // Iterate children to update their AMAF stats
-            for (int c_idx : node.children) {
-                MCTSNode& child = ctx.m_nodes[c_idx];
+            // Only children whose move was hit, found by rank in the sorted child list
+            const uint64_t* mask = ctx.child_mask(node_idx);
+            int rank_base = 0;
+
+            for (int w = 0; w < words; ++w) {
+                uint64_t matched = mask[w] & hits[w];
+
+                while (matched) {
+                    int bit = Utility::lowest_bit(matched);
+                    matched &= matched - 1;
 
-                if (ctx.rave_lookup[child.move_idx]) {
-                    child.rave_visits++;
+                    int rank = rank_base + Utility::popcount(mask[w] & ((uint64_t{1} << bit) - 1));
+                    MCTSNode& child = ctx.m_nodes[node.children[rank]];
+                    assert(child.move_idx == (w << 6) + bit);
 
-                    if (child.player_who_moved == winner) 
-                        child.rave_wins += 1.0;
+                    child.rave_visits += ctx.rave_count[0][child.move_idx] + ctx.rave_count[1][child.move_idx];
+                    child.rave_wins += ctx.rave_count[child.player_who_moved - 1][child.move_idx];
                 }
+
+                rank_base += Utility::popcount(mask[w]);
             }
 
+            if (proving && node_idx != leaf_idx) 
+                proving = try_prove(node_idx);
+
             node_idx = node.parent_idx;
         }
+
+        for (int p = 0; p < 2; ++p) 
+            for (int m : batch.moves[p + 1]) 
+                ctx.rave_count[p][m] = 0;
+
+        std::fill(hits, hits + words, 0);
     }
 
-    int MCTS::get_best_move() const {
+    template <class Board>
+    int MCTS<Board>::get_best_move() const {
         int best_move = -1, max_visits = -1;
+        int fallback_move = -1, fallback_visits = -1;
         
         if (ctx.m_nodes.empty() || ctx.m_nodes[0].children.empty()) 
             return -1;
         
-        // Robust child selection (Most Visited)
+        // Proven win first, then robust child selection (Most Visited) among
+        // moves not proven to lose; if all lose, resist as long as possible
         for (int child_idx : ctx.m_nodes[0].children) {
-            if (ctx.m_nodes[child_idx].visits > max_visits) {
-                max_visits = ctx.m_nodes[child_idx].visits;
-                best_move = ctx.m_nodes[child_idx].move_idx;
+            const auto& child = ctx.m_nodes[child_idx];
+
+            if (child.proven == Solver::WIN) 
+                return child.move_idx;
+
+            if (child.visits > fallback_visits) {
+                fallback_visits = child.visits;
+                fallback_move = child.move_idx;
+            }
+
+            if (child.proven != Solver::LOSS && child.visits > max_visits) {
+                max_visits = child.visits;
+                best_move = child.move_idx;
             }
         }
 
-        return best_move;
+        return (best_move != -1) ? best_move : fallback_move;
     }
 
-    int MCTS::run(HexBoard root_board, int time_limit_ms) {
-        auto start_time = std::chrono::steady_clock::now();
+    template <class Board>
+    void MCTS<Board>::fill_snapshot(int iterations, bool searching) {
+        auto& snap = m_snapshot;
+        const auto& root = ctx.m_nodes[0];
+
+        snap.searching  = searching;
+        snap.ply        = m_ply;
+        snap.player     = m_root_player;
+        snap.iterations = iterations;
+        snap.token      = m_stop_token;
+
+        // Root wins are counted for its mover, the opponent
+        if (root.proven != Solver::UNKNOWN) 
+            snap.value = (root.proven == Solver::LOSS) ? 1.0 : 0.0;
+        else 
+            snap.value = root.visits > 0 ? 1.0 - root.wins / root.visits : 0.5;
+
+        snap.moves.clear();
+        snap.visits.clear();
+        snap.win_rates.clear();
+        snap.pv.clear();
+
+        for (int child_idx : root.children) {
+            const auto& child = ctx.m_nodes[child_idx];
+
+            snap.moves.push_back(child.move_idx);
+            snap.visits.push_back(child.visits);
+            if (child.proven != Solver::UNKNOWN) 
+                snap.win_rates.push_back(child.proven == Solver::WIN ? 1.0 : 0.0);
+            else 
+                snap.win_rates.push_back(child.visits > 0 ? child.wins / child.visits : 0.0);
+        }
+
+        // Follow the most visited child
+        int node_idx = 0;
+        while (static_cast<int>(snap.pv.size()) < Analysis::PV_MAX_LENGTH) {
+            int best = -1, best_visits = 0;
+
+            for (int child_idx : ctx.m_nodes[node_idx].children) {
+                if (ctx.m_nodes[child_idx].visits > best_visits) {
+                    best_visits = ctx.m_nodes[child_idx].visits;
+                    best = child_idx;
+                }
+            }
+
+            if (best == -1) 
+                break;
+
+            snap.pv.push_back(ctx.m_nodes[best].move_idx);
+            node_idx = best;
+        }
+    }
+
+    template <class Board>
+    void MCTS<Board>::finish_stats(int iterations, Profiling::Clock::time_point start_time) {
+        auto end_time = Profiling::Clock::now();
+        
+        m_stats.iterations = iterations;
+        m_stats.playouts   = static_cast<int>(m_playouts);
+        m_stats.nodes      = static_cast<int>(ctx.m_nodes.size());
+        m_stats.elapsed_ms = Profiling::to_ms(end_time - start_time);
+
+        // Root mover is the opponent, so a proven root LOSS is a win for us
+        int8_t root_proof = ctx.m_nodes[0].proven;
+        m_stats.solved = (root_proof == Solver::LOSS) ? 1 : (root_proof == Solver::WIN) ? -1 : 0;
+
+        if (iterations > 0) {
+            m_stats.avg_depth          = (double)m_depth_total / iterations;
+        }
+
+        if (m_playouts > 0) 
+            m_stats.avg_playout_length = (double)m_playout_moves / m_playouts;
+
+        if (m_stats.elapsed_ms > 0.0) 
+            m_stats.playouts_per_sec = m_playouts * 1'000.0 / m_stats.elapsed_ms;
+
+        m_recorder.finish(m_stats, start_time, end_time);
+    }
+
+    template <class Board>
+    int MCTS<Board>::run(const Board& root_board) {
+        auto start_time = Profiling::Clock::now();
+        auto last_publish = start_time;
+        auto publish_interval = std::chrono::milliseconds(Analysis::g_interval_ms.load(std::memory_order_relaxed));
         int iterations = 0;
 
+        // Check time every ~256 playouts to reduce syscall overhead
+        const int check_every = std::max(1, 256 / std::max(1, m_cfg.leaf_playouts));
+
+        start_workers(root_board);
+
         while (true) {
-            // Check time every 256 iterations to reduce syscall overhead
-            if ((iterations & 0xFF) == 0) {
-                auto now = std::chrono::steady_clock::now();
+            if (m_cfg.max_iterations > 0 && iterations >= m_cfg.max_iterations) 
+                break;
+
+            if (iterations > 0 && iterations % check_every == 0) {
+                auto now = Profiling::Clock::now();
 
-                if (std::chrono::duration_cast<std::chrono::milliseconds>(now - start_time).count() >= time_limit_ms) 
+                if (m_cfg.time_limit_ms > 0 && 
+                    std::chrono::duration_cast<std::chrono::milliseconds>(now - start_time).count() >= m_cfg.time_limit_ms) 
                     break;
                 
-                // Safety: Stop if we run out of node memory
-                if (ctx.m_nodes.size() >= MCTSParams::NODE_POOL_SIZE - 200) 
+                // Safety: Stop if we run out of node memory (one node per iteration)
+                if (ctx.m_nodes.size() + 0x100 >= static_cast<size_t>(m_cfg.node_pool_size)) 
                     break; 
+
+                if (Analysis::g_stop_generation.load(std::memory_order_relaxed) != m_stop_token) 
+                    break;
+
+                if (publish_interval.count() > 0 && now - last_publish >= publish_interval) {
+                    fill_snapshot(iterations, true);
+                    Analysis::publish(m_snapshot, false);
+                    last_publish = now;
+                }
             }
 
+            // Solved root, more iterations cannot change the answer
+            if (ctx.m_nodes[0].proven != Solver::UNKNOWN) 
+                break;
+
             int node_idx = 0;
-            HexBoard board = root_board;
+            int depth = 0;
+            Board board = root_board;
 
             // 1. Selection
-            while (ctx.m_nodes[node_idx].untried.empty() && !ctx.m_nodes[node_idx].children.empty()) {
+            auto t = m_recorder.begin();
+
+            while (ctx.m_nodes[node_idx].proven == Solver::UNKNOWN && 
+                   ctx.m_nodes[node_idx].untried_left == 0 && !ctx.m_nodes[node_idx].children.empty()) {
                 int child = select_child(node_idx);
 
                 if (child == -1) 
                     break;
 
                 node_idx = child;
+                depth++;
                 auto [r, c] = board.get_coord(ctx.m_nodes[node_idx].move_idx);
                 board.make_move(r, c, ctx.m_nodes[node_idx].player_who_moved);
             }
 
+            m_recorder.end(Profiling::SELECTION, t);
+
             // 2. Expansion
-            if (!ctx.m_nodes[node_idx].untried.empty()) 
-                node_idx = expand(node_idx, board);
+            if (ctx.m_nodes[node_idx].untried_left > 0) {
+                t = m_recorder.begin();
+                depth++;
+                node_idx = expand(node_idx, board, depth);
+                m_recorder.end(Profiling::EXPANSION, t);
+            }
 
-            // 3. Simulation
-            int sim_player = Utility::toggle_player(ctx.m_nodes[node_idx].player_who_moved);
-            auto result = simulate(board, sim_player);
+            // 3. Simulation, proven nodes already know the result
+            int winner = proven_winner(node_idx);
 
-            // 4. Backpropagation
-            backpropagate(node_idx, result.first, result.second);
+            if (winner == EMPTY) {
+                t = m_recorder.begin();
+                int sim_player = Utility::toggle_player(ctx.m_nodes[node_idx].player_who_moved);
+                const LeafBatch& batch = run_playouts(board, sim_player);
+                m_recorder.end(Profiling::SIMULATION, t);
+
+                m_playouts += batch.playouts;
+                m_playout_moves += batch.playout_moves;
+
+                // 4. Backpropagation
+                t = m_recorder.begin();
+                backpropagate(node_idx, batch);
+                m_recorder.end(Profiling::BACKPROPAGATION, t);
+
+            } else {
+                LeafBatch& proof = m_batches[0];
+                proof.clear();
+                proof.playouts = 1;
+                proof.wins[winner] = 1;
+
+                t = m_recorder.begin();
+                backpropagate(node_idx, proof);
+                m_recorder.end(Profiling::BACKPROPAGATION, t);
+            }
             
+            m_depth_total += depth;
+            m_stats.max_depth = std::max(m_stats.max_depth, depth);
             iterations++;
         }
 
+        finish_stats(iterations, start_time);
+
+        fill_snapshot(iterations, false);
+        Analysis::publish(m_snapshot, true);
+
         return get_best_move();
     }
 
+    template <class Board>
+    int search(const HexBoard& game, int player, const SearchConfig& config, uint64_t stop_token) {
+        MCTS<Board> solver(game, player, config, stop_token);
+
+        int move = solver.run(Board(game));
+        Profiling::publish(solver.stats());
+
+        return move;
+    }
+
 } // anonymous namespace
 
+SearchConfig SearchConfig::from_difficulty(Difficulty diff) {
+    SearchConfig cfg;
+    cfg.time_limit_ms = MCTSParams::TIME_LIMITS[static_cast<int>(diff)];
+    cfg.rave_bias = (diff == Difficulty::HARD) ? MCTSParams::RAVE_BIAS_HARD : MCTSParams::RAVE_BIAS_OTHER;
+
+    return cfg;
+}
+
 int HexAI::get_move(HexBoard& game, int player, Difficulty diff) {
+    return get_move(game, player, SearchConfig::from_difficulty(diff));
+}
+
+int HexAI::get_move(HexBoard& game, int player, const SearchConfig& config) {
+    return get_move(game, player, config, stop_token());
+}
+
+int HexAI::get_move(HexBoard& game, int player, const SearchConfig& config, uint64_t stop_token) {
     ctx.ensure_buffer_size(game.rows * game.cols);
 
     // Instant Win/Loss Check (Depth 1)
     auto legal = game.get_legal_moves();
     int opponent = Utility::toggle_player(player);
+    int ply = game.rows * game.cols - static_cast<int>(legal.size());
+
+    // One scratch copy, each probe is taken back
+    HexBoard tmp = game;
 
     auto find_instant_outcome = [&](int who) -> int {
         for (int m : legal) {
-            HexBoard tmp = game;
-
             auto [r, c] = tmp.get_coord(m);
             tmp.make_move(r, c, who);
 
-            if (tmp.check_win() == who) 
+            bool wins = tmp.check_win() == who;
+            tmp.undo();
+
+            if (wins) 
                 return m;
         }
 
@@ -480,16 +1382,76 @@ int HexAI::get_move(HexBoard& game, int player, Difficulty diff) {
     };
 
     // Check for immediate win
-    if (int win = find_instant_outcome(player); win != -1) 
+    if (int win = find_instant_outcome(player); win != -1) {
+        Profiling::publish(SearchStats{});
+        Analysis::publish_forced(ply, player, win, 1.0, stop_token);
         return win;
+    }
 
-    // Check for immediate loss (Block)
-    if (int block = find_instant_outcome(opponent); block != -1) 
+    // Check for immediate loss (Block), the outcome is still open
+    if (int block = find_instant_outcome(opponent); block != -1) {
+        Profiling::publish(SearchStats{});
+        Analysis::publish_forced(ply, player, block, 0.5, stop_token);
         return block;
+    }
     
-    // Run MCTS
-    int time_limit = MCTSParams::TIME_LIMITS[static_cast<int>(diff)];
-    MCTS solver(game, player, diff);
-    
-    return solver.run(game, time_limit);
+    // Run MCTS, on a compile-time sized board when one exists
+    if (game.rows == game.cols) {
+        switch (game.rows) {
+#define HEX_FIXED_CASE(S) case S: return search<FixedHexBoard<S>>(game, player, config, stop_token);
+            HEX_FIXED_SIZES(HEX_FIXED_CASE)
+#undef HEX_FIXED_CASE
+        }
+    }
+
+    return search<LeanHexBoard>(game, player, config, stop_token);
+}
+
+void HexAI::set_profiling(bool enabled, const std::string& trace_path) {
+    std::lock_guard<std::mutex> lock(Profiling::g_mutex);
+    Profiling::g_trace_path = trace_path;
+    Profiling::g_enabled.store(enabled && HEX_PROFILING, std::memory_order_relaxed);
+}
+
+bool HexAI::is_profiling() {
+    return Profiling::g_enabled.load(std::memory_order_relaxed);
+}
+
+SearchStats HexAI::get_last_stats() {
+    std::lock_guard<std::mutex> lock(Profiling::g_mutex);
+    return Profiling::g_last_stats;
+}
+
+AnalysisSnapshot HexAI::get_analysis() {
+    std::lock_guard<std::mutex> lock(Analysis::g_mutex);
+    return Analysis::g_snapshot;
+}
+
+void HexAI::set_analysis_interval(int interval_ms) {
+    Analysis::g_interval_ms.store(std::max(0, interval_ms), std::memory_order_relaxed);
+}
+
+bool HexAI::load_patterns(const std::string& path) {
+    auto table = std::make_shared<PatternTable>();
+    if (!table->load(path)) 
+        return false;
+
+    Patterns::install(std::move(table));
+    return true;
+}
+
+void HexAI::set_patterns(const PatternTable& table) {
+    Patterns::install(std::make_shared<const PatternTable>(table));
+}
+
+PatternTable HexAI::get_patterns() {
+    return *Patterns::current();
+}
+
+void HexAI::stop() {
+    Analysis::g_stop_generation.fetch_add(1, std::memory_order_relaxed);
+}
+
+uint64_t HexAI::stop_token() {
+    return Analysis::g_stop_generation.load(std::memory_order_relaxed);
 }
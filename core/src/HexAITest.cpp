@@ -1,11 +1,19 @@
 #include "HexBoard.hpp"
 #include "HexAI.hpp"
+#include "LeanHexBoard.hpp"
+#include "FixedHexBoard.hpp"
+#include "PatternSampler.hpp"
 
 #include <chrono>
+#include <random>
 #include <string>
 #include <thread>
+#include <vector>
 #include <iomanip>
 #include <iostream>
+#include <cmath>
+#include <algorithm>
+#include <stdexcept>
 
 // Constants
 
@@ -226,7 +234,535 @@ void run_benchmark() {
     std::cout << "Avg Moves:  " << (int)(stats.moves_total / cfg.num_games) << "\n";
 }
 
-int main() {
+// Self-checks of the pure-logic parts, non-interactive: hex_test --check
+
+namespace Checks {
+    std::mt19937 rng(12345);
+
+    int other(int player) {
+        return (player == PLAYER_1) ? PLAYER_2 : PLAYER_1;
+    }
+
+    bool report(const std::string& name, int failures, int cases) {
+        std::cout << (failures == 0 ? "[PASS] " : "[FAIL] ") << name << ": "
+                  << (cases - failures) << "/" << cases << "\n";
+
+        return failures == 0;
+    }
+
+    // Random position with `stones` alternating stones and no winner yet
+    HexBoard random_position(int size, int stones) {
+        while (true) {
+            HexBoard game(size, size);
+            std::vector<int> cells(size * size);
+            for (int i = 0; i < size * size; ++i) 
+                cells[i] = i;
+
+            std::shuffle(cells.begin(), cells.end(), rng);
+
+            int player = PLAYER_1;
+            for (int k = 0; k < stones; ++k) {
+                auto [r, c] = game.get_coord(cells[k]);
+                game.make_move(r, c, player);
+                player = other(player);
+            }
+
+            if (game.check_win() == EMPTY) 
+                return game;
+        }
+    }
+
+    // Brute-force minimax: can the player to move force a win
+    bool wins(HexBoard& game, int player) {
+        for (int m : game.get_legal_moves()) {
+            auto [r, c] = game.get_coord(m);
+            game.make_move(r, c, player);
+
+            bool win = game.check_win() == player || !wins(game, other(player));
+            game.undo();
+
+            if (win) 
+                return true;
+        }
+
+        return false;
+    }
+
+    // MCTS-Solver against minimax on 3x3: a proven root must agree, and in a
+    // won position the chosen move must keep the win
+    bool solver_matches_minimax() {
+        int failures = 0, cases = 200;
+
+        SearchConfig cfg;
+        cfg.time_limit_ms = 0;
+        cfg.max_iterations = 20'000;
+
+        for (int t = 0; t < cases; ++t) {
+            HexBoard game = random_position(3, 1 + t % 4);
+            int player = (t % 2 == 0) ? PLAYER_1 : PLAYER_2;
+
+            bool win = wins(game, player);
+            int move = HexAI::get_move(game, player, cfg);
+            int solved = HexAI::get_last_stats().solved;
+
+            auto [r, c] = game.get_coord(move);
+            game.make_move(r, c, player);
+            bool keeps = game.check_win() == player || !wins(game, other(player));
+            game.undo();
+
+            if ((solved == 1 && !win) || (solved == -1 && win) || (win && !keeps)) 
+                failures++;
+        }
+
+        return report("solver matches minimax (3x3)", failures, cases);
+    }
+
+    // Random game of `moves` legal moves, may end in a win
+    HexBoard random_game(int rows, int cols, int moves) {
+        HexBoard game(rows, cols);
+        std::vector<int> cells(rows * cols);
+        for (int i = 0; i < rows * cols; ++i) 
+            cells[i] = i;
+
+        std::shuffle(cells.begin(), cells.end(), rng);
+
+        int player = PLAYER_1;
+        for (int k = 0; k < moves; ++k) {
+            auto [r, c] = game.get_coord(cells[k]);
+            game.make_move(r, c, player);
+            player = other(player);
+        }
+
+        return game;
+    }
+
+    bool same_board(HexBoard& a, HexBoard& b) {
+        if (a.rows != b.rows || a.cols != b.cols || a.get_history() != b.get_history()) 
+            return false;
+
+        for (int i = 0; i < a.rows * a.cols; ++i) 
+            if (a.get_cell_by_index(i) != b.get_cell_by_index(i)) 
+                return false;
+
+        return a.check_win() == b.check_win();
+    }
+
+    // to_bytes / from_bytes round trips, with and without the DSU section, must
+    // give the same board and undo history; forged DSU state must be rejected
+    bool serialization_round_trips() {
+        int failures = 0, cases = 300;
+
+        for (int t = 0; t < cases; ++t) {
+            int rows = 2 + rng() % 12, cols = 2 + rng() % 12;
+            HexBoard game = random_game(rows, cols, rng() % (rows * cols + 1));
+            bool include_dsu = t % 2 == 0;
+
+            std::string data = game.serialize(include_dsu);
+            HexBoard loaded = HexBoard::deserialize(data);
+            bool ok = loaded.serialize(include_dsu) == data && same_board(game, loaded);
+
+            while (ok && game.undo()) 
+                ok = loaded.undo() && same_board(game, loaded);
+
+            if (!ok) 
+                failures++;
+        }
+
+        // Parent cycle between two Red stones: parent[0] = 1, parent[1] = 0
+        HexBoard game(3, 3);
+        game.make_move(0, 0, PLAYER_1);
+        game.make_move(2, 2, PLAYER_2);
+        game.make_move(0, 1, PLAYER_1);
+
+        std::string data = game.serialize(true);
+        const size_t parents = 13 + 3 + 2 * 3;    // header, 9 cells at 2 bits, 3 moves
+        data[parents] = 1;
+        data[parents + 2] = 0;
+
+        cases++;
+        try {
+            HexBoard::deserialize(data);
+            failures++;
+        } catch (const std::invalid_argument&) {}
+
+        return report("serialization round trips", failures, cases);
+    }
+
+    // Random play with takebacks must match a fresh board replaying the history,
+    // and the lean search board must agree with HexBoard move by move
+    bool undo_matches_replay() {
+        int failures = 0, cases = 300;
+
+        for (int t = 0; t < cases; ++t) {
+            int rows = 2 + rng() % 12, cols = 2 + rng() % 12;
+            HexBoard game(rows, cols);
+            int player = PLAYER_1;
+            bool ok = true;
+
+            for (int step = 0; ok && step < 3 * rows * cols; ++step) {
+                auto legal = game.get_legal_moves();
+
+                if (!game.get_history().empty() && (legal.empty() || rng() % 3 == 0)) {
+                    ok = game.undo();
+                    player = other(player);
+                } else if (!legal.empty() && game.check_win() == EMPTY) {
+                    auto [r, c] = game.get_coord(legal[rng() % legal.size()]);
+                    ok = game.make_move(r, c, player);
+                    player = other(player);
+                } else {
+                    ok = game.undo();
+                    player = other(player);
+                }
+
+                HexBoard replay(rows, cols);
+                for (int idx : game.get_history()) {
+                    auto [r, c] = replay.get_coord(idx);
+                    replay.make_move(r, c, game.get_cell_by_index(idx));
+                }
+
+                ok = ok && same_board(game, replay) && game.get_winning_path(PLAYER_1) == replay.get_winning_path(PLAYER_1) 
+                        && game.get_winning_path(PLAYER_2) == replay.get_winning_path(PLAYER_2);
+
+                LeanHexBoard lean(game);
+                std::vector<int> d1, d2;
+
+                for (int p : {PLAYER_1, PLAYER_2}) 
+                    ok = ok && game.get_distance_map(p, false, d1) == lean.get_distance_map(p, false, d2) && d1 == d2;
+
+                ok = ok && game.check_win() == lean.check_win();
+            }
+
+            if (!ok) 
+                failures++;
+        }
+
+        return report("undo matches replay", failures, cases);
+    }
+
+    // Searches on fixed-size and lean boards, with and without leaf batches, must
+    // return a legal move. Builds without NDEBUG also assert the RAVE child rank lookup
+    bool searches_return_legal_moves() {
+        int failures = 0, cases = 0;
+
+        for (int size : {5, 7, 8, 12}) {
+            for (int leaf_playouts : {1, 4}) {
+                SearchConfig cfg;
+                cfg.time_limit_ms = 0;
+                cfg.max_iterations = 3'000;
+                cfg.leaf_playouts = leaf_playouts;
+
+                for (int t = 0; t < 5; ++t) {
+                    HexBoard game = random_position(size, static_cast<int>(rng() % (size * size / 2)));
+                    int player = (t % 2 == 0) ? PLAYER_1 : PLAYER_2;
+                    int move = HexAI::get_move(game, player, cfg);
+
+                    auto [r, c] = game.get_coord(move);
+                    if (move < 0 || !game.make_move(r, c, player)) 
+                        failures++;
+
+                    cases++;
+                }
+            }
+        }
+
+        return report("searches return legal moves", failures, cases);
+    }
+
+    // Sampler state after each incremental stone must match a fresh encode of
+    // the board: pattern weight on empty cells, zero on stones, consistent block sums
+    bool sampler_matches_encode(const PatternSampler& sampler, const HexBoard& game, const PatternTable& table) {
+        for (int p = 0; p < 2; ++p) {
+            double total = 0.0;
+            std::vector<double> blocks(sampler.block_count, 0.0);
+
+            for (int i = 0; i < sampler.N; ++i) {
+                bool empty = game.get_cell_by_index(i) == EMPTY;
+                double w = empty ? table.get_weight(p + 1, PatternTable::encode(game, sampler.slots[i])) : 0.0;
+
+                if (sampler.weights[p][i] != w || sampler.cells[i] != game.get_cell_by_index(i)) 
+                    return false;
+
+                blocks[i >> PatternSampler::BLOCK_SHIFT] += w;
+                total += w;
+            }
+
+            for (int b = 0; b < sampler.block_count; ++b) 
+                if (std::abs(sampler.blocks[p][b] - blocks[b]) > 1e-6) 
+                    return false;
+
+            if (std::abs(sampler.total[p] - total) > 1e-6) 
+                return false;
+        }
+
+        return true;
+    }
+
+    bool pattern_sampler_tracks_board() {
+        int failures = 0, cases = 200;
+
+        // Random weights with plenty of zeros, so zero-weight empty cells are covered
+        PatternTable table;
+        for (int p : {PLAYER_1, PLAYER_2}) 
+            for (int code = 0; code < PatternTable::PATTERN_COUNT; ++code) 
+                table.set_weight(p, code, rng() % 4 == 0 ? 0.0f : std::uniform_real_distribution<float>(0.0f, 2.0f)(rng));
+
+        PatternSampler sampler;
+
+        for (int t = 0; t < cases; ++t) {
+            int rows = 2 + rng() % 12, cols = 2 + rng() % 12;
+            HexBoard game = random_game(rows, cols, rng() % (rows * cols / 2 + 1));
+            HexBoard root = game;
+
+            sampler.prepare_root(game, &table);
+            bool ok = sampler_matches_encode(sampler, game, table);
+
+            auto legal = game.get_legal_moves();
+            std::shuffle(legal.begin(), legal.end(), rng);
+            int player = (game.get_history().size() % 2 == 0) ? PLAYER_1 : PLAYER_2;
+
+            for (int idx : legal) {
+                if (!ok) 
+                    break;
+
+                auto [r, c] = game.get_coord(idx);
+                game.make_move(r, c, player);
+                sampler.place(idx, player);
+                player = other(player);
+
+                ok = sampler_matches_encode(sampler, game, table);
+            }
+
+            // Restoring the root and replaying the difference must land in the same state
+            sampler.reset(root);
+            ok = ok && sampler_matches_encode(sampler, root, table);
+            sampler.reset(game);
+            ok = ok && sampler_matches_encode(sampler, game, table);
+
+            if (!ok) 
+                failures++;
+        }
+
+        return report("pattern sampler tracks board", failures, cases);
+    }
+
+    // Leaf batches split over helper threads must back up exactly what sequential
+    // batches do: leaf_playouts per iteration into the root and its children.
+    // With prior_visits = 0 the child visits and wins are playouts only
+    bool leaf_threads_keep_playout_counts() {
+        int failures = 0, cases = 0;
+
+        for (int size : {8, 9}) {
+            for (int leaf_playouts : {3, 4}) {
+                for (int t = 0; t < 3; ++t) {
+                    HexBoard game = random_position(size, static_cast<int>(rng() % (size * size / 4)));
+                    int player = (t % 2 == 0) ? PLAYER_1 : PLAYER_2;
+                    long long totals[2] = {0, 0};
+                    bool ok = true;
+
+                    for (int leaf_threads : {0, 2}) {
+                        SearchConfig cfg;
+                        cfg.time_limit_ms = 0;
+                        cfg.max_iterations = 400;
+                        cfg.prior_visits = 0;
+                        cfg.leaf_playouts = leaf_playouts;
+                        cfg.leaf_threads = leaf_threads;
+
+                        HexAI::get_move(game, player, cfg);
+                        SearchStats stats = HexAI::get_last_stats();
+                        AnalysisSnapshot snap = HexAI::get_analysis();
+
+                        long long visits = 0;
+                        double wins = 0.0;
+                        for (size_t i = 0; i < snap.moves.size(); ++i) {
+                            visits += snap.visits[i];
+                            wins += snap.visits[i] * snap.win_rates[i];
+                        }
+
+                        // Root wins are the complement of its children's
+                        ok = ok && stats.solved == 0 && stats.iterations == cfg.max_iterations 
+                                && stats.playouts == stats.iterations * leaf_playouts && visits == stats.playouts 
+                                && std::abs(snap.value * visits - wins) < 1e-6 * visits;
+
+                        totals[leaf_threads > 0] = visits;
+                    }
+
+                    if (!ok || totals[0] != totals[1]) 
+                        failures++;
+
+                    cases++;
+                }
+            }
+        }
+
+        return report("leaf threads keep playout counts", failures, cases);
+    }
+
+    // Compile-time board against HexBoard over whole random games: cells, winner
+    // and both players' distance maps in both directions after every stone
+    template <int S>
+    int fixed_board_failures(int games) {
+        int failures = 0;
+
+        for (int t = 0; t < games; ++t) {
+            HexBoard game(S, S);
+            FixedHexBoard<S> fixed;
+            std::vector<int> cells(S * S);
+            for (int i = 0; i < S * S; ++i) 
+                cells[i] = i;
+
+            std::shuffle(cells.begin(), cells.end(), rng);
+
+            auto agrees = [&](FixedHexBoard<S>& board) {
+                std::vector<int> d1, d2;
+
+                for (int i = 0; i < S * S; ++i) 
+                    if (board.get_cell_by_index(i) != game.get_cell_by_index(i)) 
+                        return false;
+
+                for (int p : {PLAYER_1, PLAYER_2}) 
+                    for (bool reverse : {false, true}) 
+                        if (game.get_distance_map(p, reverse, d1) != board.get_distance_map(p, reverse, d2) || d1 != d2) 
+                            return false;
+
+                return game.check_win() == board.check_win();
+            };
+
+            int player = PLAYER_1;
+            bool ok = true;
+
+            for (int k = 0; ok && k < S * S; ++k) {
+                auto [r, c] = game.get_coord(cells[k]);
+                ok = game.make_move(r, c, player) && fixed.make_move(r, c, player) && agrees(fixed);
+                player = other(player);
+
+                // The search builds its root from a HexBoard
+                if (ok && k % 8 == 0) {
+                    FixedHexBoard<S> copy(game);
+                    ok = agrees(copy);
+                }
+            }
+
+            if (!ok) 
+                failures++;
+        }
+
+        return failures;
+    }
+
+    bool fixed_boards_match_hexboard() {
+        int failures = 0, cases = 0;
+        const int games = 20;
+
+#define HEX_CHECK_SIZE(S) failures += fixed_board_failures<S>(games); cases += games;
+        HEX_FIXED_SIZES(HEX_CHECK_SIZE)
+#undef HEX_CHECK_SIZE
+
+        return report("fixed boards match HexBoard", failures, cases);
+    }
+
+    // Root moves in the order the search expands them: a search of k iterations
+    // expands exactly the first k, one per iteration. Empty if a forced move skips the search
+    std::vector<int> expansion_order(HexBoard& game, int player, SearchConfig cfg) {
+        std::vector<int> order, seen;
+        const int legal = static_cast<int>(game.get_legal_moves().size());
+
+        for (int k = 1; k <= legal; ++k) {
+            cfg.max_iterations = k;
+            HexAI::get_move(game, player, cfg);
+            AnalysisSnapshot snap = HexAI::get_analysis();
+
+            if (snap.iterations == 0) 
+                return {};
+
+            for (int m : snap.moves) 
+                if (std::find(seen.begin(), seen.end(), m) == seen.end()) 
+                    order.push_back(m);
+
+            seen = snap.moves;
+        }
+
+        return order;
+    }
+
+    // Lazy expansion must yield every legal move exactly once. With priors the
+    // moves come off the heap by non-increasing prior, which huge prior_visits make
+    // the child win rates. Without, the static order goes out from the center twice,
+    // bridge moves first, so the distance to the center drops at most once
+    bool expansion_yields_each_move_once() {
+        int failures = 0, cases = 0;
+
+        for (int size : {5, 6, 7}) {
+            for (bool use_priors : {true, false}) {
+                SearchConfig cfg;
+                cfg.time_limit_ms = 0;
+                cfg.use_priors = use_priors;
+                cfg.prior_visits = 1 << 30;
+
+                for (int t = 0; t < 5; ++t) {
+                    HexBoard game = random_position(size, static_cast<int>(rng() % (size * size / 3)));
+                    int player = (t % 2 == 0) ? PLAYER_1 : PLAYER_2;
+
+                    std::vector<int> order = expansion_order(game, player, cfg);
+                    if (order.empty()) 
+                        continue;
+
+                    std::vector<int> sorted = order, legal = game.get_legal_moves();
+                    std::sort(sorted.begin(), sorted.end());
+                    std::sort(legal.begin(), legal.end());
+                    bool ok = sorted == legal;
+
+                    if (ok && use_priors) {
+                        AnalysisSnapshot snap = HexAI::get_analysis();
+                        std::vector<double> rate(size * size, 0.0);
+                        for (size_t i = 0; i < snap.moves.size(); ++i) 
+                            rate[snap.moves[i]] = snap.win_rates[i];
+
+                        // One playout moves a win rate by at most 1 / prior_visits
+                        for (size_t i = 1; i < order.size(); ++i) 
+                            ok = ok && rate[order[i]] <= rate[order[i - 1]] + 2.0 / cfg.prior_visits;
+
+                    } else if (ok) {
+                        int drops = 0;
+                        auto dist = [&](int m) {
+                            return std::abs(m / size - size / 2) + std::abs(m % size - size / 2);
+                        };
+
+                        for (size_t i = 1; i < order.size(); ++i) 
+                            drops += dist(order[i]) < dist(order[i - 1]);
+
+                        ok = drops <= 1;
+                    }
+
+                    if (!ok) 
+                        failures++;
+
+                    cases++;
+                }
+            }
+        }
+
+        return report("expansion yields each move once", failures, cases);
+    }
+
+    bool run_all() {
+        bool ok = true;
+        ok &= solver_matches_minimax();
+        ok &= serialization_round_trips();
+        ok &= undo_matches_replay();
+        ok &= fixed_boards_match_hexboard();
+        ok &= searches_return_legal_moves();
+        ok &= expansion_yields_each_move_once();
+        ok &= pattern_sampler_tracks_board();
+        ok &= leaf_threads_keep_playout_counts();
+
+        return ok;
+    }
+}
+
+int main(int argc, char** argv) {
+    if (argc > 1 && std::string(argv[1]) == "--check") 
+        return Checks::run_all() ? 0 : 1;
+
     run_benchmark();
     return 0;
 }
@@ -1,8 +1,11 @@
 #include "HexBoard.hpp"
 
 #include <deque>
+#include <algorithm>
+#include <cstdint>
 #include <iomanip>
 #include <iostream>
+#include <stdexcept>
 
 namespace Colors {
     const std::string RESET = "\033[0m";
@@ -11,6 +14,86 @@ namespace Colors {
     const std::string GRAY  = "\033[90m";
 }
 
+namespace Serial {
+    const std::string MAGIC = "HXB1";
+    constexpr uint8_t FLAG_DSU = 1;
+
+    // Cells and history are stored as uint16
+    constexpr int MAX_CELLS = 0xFFFF - 4;
+
+    void put_u8(std::string& out, int v) {
+        out.push_back(static_cast<char>(v & 0xFF));
+    }
+
+    void put_u16(std::string& out, int v) {
+        put_u8(out, v);
+        put_u8(out, v >> 8);
+    }
+
+    void put_u32(std::string& out, uint32_t v) {
+        put_u16(out, static_cast<int>(v & 0xFFFF));
+        put_u16(out, static_cast<int>(v >> 16));
+    }
+
+    // Little-endian reads with bounds checks
+    struct Reader {
+        const std::string& data;
+        size_t pos = 0;
+
+        int u8() {
+            if (pos >= data.size()) 
+                throw std::invalid_argument("HexBoard data is truncated");
+
+            return static_cast<uint8_t>(data[pos++]);
+        }
+
+        int u16() {
+            int lo = u8();
+            return lo | (u8() << 8);
+        }
+
+        uint32_t u32() {
+            uint32_t lo = u16();
+            return lo | (static_cast<uint32_t>(u16()) << 16);
+        }
+    };
+
+    // Checks that the log is exactly the union-by-rank history of the parent / rank
+    // arrays: undoing it from the back must detach a child from a root each step,
+    // with ranks that fit, and end at all singletons of rank 0. `member(i)` tells
+    // which nodes may be joined at all (the player's stones and edges)
+    template <class Member>
+    bool valid_dsu(std::vector<int> parents, std::vector<int> ranks, const std::vector<RollbackDSU::Union>& log, Member member) {
+        const int n = static_cast<int>(parents.size());
+
+        for (int i = 0; i < n; ++i) 
+            if (parents[i] != i && !member(i)) 
+                return false;
+
+        for (auto it = log.rbegin(); it != log.rend(); ++it) {
+            int child = it->child;
+            int root = parents[child];
+
+            if (root == child || parents[root] != root) 
+                return false;
+
+            if (it->bumped ? ranks[root] != ranks[child] + 1 : ranks[root] <= ranks[child]) 
+                return false;
+
+            if (it->bumped) 
+                ranks[root]--;
+
+            parents[child] = child;
+        }
+
+        for (int i = 0; i < n; ++i) 
+            if (parents[i] != i || ranks[i] != 0) 
+                return false;
+
+        return true;
+    }
+}
+
 HexBoard::HexBoard(int r, int c)
     : rows(r), cols(c) 
 {
@@ -25,6 +108,8 @@ HexBoard::HexBoard(int r, int c)
 
     dsu_p1.resize(N + 4);
     dsu_p2.resize(N + 4);
+    history.reserve(N);
+    undo_marks.reserve(N);
 
     build_adjacency();
 }
@@ -56,6 +141,10 @@ const std::vector<int>& HexBoard::get_neighbors(int idx) const {
     return (*adj)[idx];
 }
 
+std::shared_ptr<const std::vector<std::vector<int>>> HexBoard::get_adjacency() const {
+    return adj;
+}
+
 std::vector<int> HexBoard::get_legal_moves() const {
     std::vector<int> legal;
     legal.reserve(board.size());
@@ -75,9 +164,66 @@ bool HexBoard::make_move(int r, int c, int player) {
     if (board[idx] != EMPTY) 
         return false;
 
+    place(idx, player);
+
+    return true;
+}
+
+int HexBoard::apply_moves(const std::vector<int>& moves, int first_player) {
+    const int N = rows * cols;
+    int player = first_player;
+    int applied = 0;
+
+    for (int idx : moves) {
+        if (idx < 0 || idx >= N || board[idx] != EMPTY) 
+            break;
+
+        place(idx, player);
+
+        player = (player == PLAYER_1) ? PLAYER_2 : PLAYER_1;
+        applied++;
+    }
+
+    return applied;
+}
+
+bool HexBoard::undo() {
+    if (history.empty()) 
+        return false;
+
+    int idx = history.back();
+    RollbackDSU& dsu = (board[idx] == PLAYER_1) ? dsu_p1 : dsu_p2;
+
+    dsu.rollback(undo_marks.back());
+    board[idx] = EMPTY;
+
+    history.pop_back();
+    undo_marks.pop_back();
+
+    return true;
+}
+
+const std::vector<int>& HexBoard::get_history() const {
+    return history;
+}
+
+void HexBoard::place(int idx, int player) {
     board[idx] = player;
 
-    // Update DSU based on adjacency
+    // Copies drop spare capacity, grow once to the full game length
+    if (history.capacity() == history.size()) {
+        history.reserve(board.size());
+        undo_marks.reserve(board.size());
+    }
+
+    history.push_back(idx);
+    undo_marks.push_back(player == PLAYER_1 ? dsu_p1.checkpoint() : dsu_p2.checkpoint());
+
+    connect(idx, player);
+}
+
+// Update DSU based on adjacency
+void HexBoard::connect(int idx, int player) {
     const auto& neighbors = (*adj)[idx];
 
     for (int nb : neighbors) {
@@ -101,8 +247,6 @@ bool HexBoard::make_move(int r, int c, int player) {
                 dsu_p2.unite(idx, nb);
         }
     }
-
-    return true;
 }
 
 int HexBoard::check_win() {
@@ -115,6 +259,167 @@ int HexBoard::check_win() {
     return EMPTY;
 }
 
+std::string HexBoard::serialize(bool include_dsu) const {
+    using namespace Serial;
+
+    const int N = rows * cols;
+    if (N > MAX_CELLS) 
+        throw std::invalid_argument("Board is too large to serialize");
+
+    std::string out = MAGIC;
+    out.reserve(MAGIC.size() + 9 + (N + 3) / 4 + 2 * history.size() + (include_dsu ? 12 * (N + 4) : 0));
+
+    put_u8(out, include_dsu ? FLAG_DSU : 0);
+    put_u16(out, rows);
+    put_u16(out, cols);
+    put_u32(out, static_cast<uint32_t>(history.size()));
+
+    for (int i = 0; i < N; i += 4) {
+        int packed = 0;
+        for (int k = 0; k < 4 && i + k < N; ++k) 
+            packed |= board[i + k] << (2 * k);
+
+        put_u8(out, packed);
+    }
+
+    for (int idx : history) 
+        put_u16(out, idx);
+
+    if (include_dsu) {
+        for (const RollbackDSU* dsu : {&dsu_p1, &dsu_p2}) {
+            for (int p : dsu->get_parents()) 
+                put_u16(out, p);
+
+            for (int r : dsu->get_ranks()) 
+                put_u8(out, r);
+
+            // At most N + 3 unions can succeed
+            put_u16(out, static_cast<int>(dsu->get_log().size()));
+            for (const auto& u : dsu->get_log()) {
+                put_u16(out, u.child);
+                put_u8(out, u.bumped);
+            }
+        }
+
+        for (int mark : undo_marks) 
+            put_u16(out, mark);
+    }
+
+    return out;
+}
+
+HexBoard HexBoard::deserialize(const std::string& data) {
+    using namespace Serial;
+
+    if (data.compare(0, MAGIC.size(), MAGIC) != 0) 
+        throw std::invalid_argument("Not a serialized HexBoard");
+
+    Reader in{data, MAGIC.size()};
+    int flags = in.u8();
+    int r = in.u16();
+    int c = in.u16();
+    uint32_t moves = in.u32();
+
+    const int64_t cells_64 = static_cast<int64_t>(r) * c;
+    if (r <= 0 || c <= 0 || cells_64 > MAX_CELLS || moves > static_cast<uint64_t>(cells_64)) 
+        throw std::invalid_argument("Invalid HexBoard header");
+
+    HexBoard game(r, c);
+    const int N = r * c;
+
+    std::vector<int> cells(N);
+    for (int i = 0; i < N; i += 4) {
+        int packed = in.u8();
+
+        for (int k = 0; k < 4 && i + k < N; ++k) {
+            int cell = (packed >> (2 * k)) & 3;
+            if (cell > PLAYER_2) 
+                throw std::invalid_argument("Invalid HexBoard cell");
+
+            cells[i + k] = cell;
+        }
+    }
+
+    // Every stone must appear in the history exactly once
+    std::vector<int> history(moves);
+    std::vector<bool> seen(N, false);
+
+    for (auto& idx : history) {
+        idx = in.u16();
+
+        if (idx >= N || cells[idx] == EMPTY || seen[idx]) 
+            throw std::invalid_argument("Invalid HexBoard history");
+
+        seen[idx] = true;
+    }
+
+    if (std::count(cells.begin(), cells.end(), EMPTY) != N - static_cast<int>(moves)) 
+        throw std::invalid_argument("HexBoard cells do not match the history");
+
+    if (flags & FLAG_DSU) {
+        for (int player : {PLAYER_1, PLAYER_2}) {
+            RollbackDSU* dsu = (player == PLAYER_1) ? &game.dsu_p1 : &game.dsu_p2;
+            std::vector<int> parents(N + 4), ranks(N + 4);
+
+            for (auto& p : parents) {
+                p = in.u16();
+                if (p >= N + 4) 
+                    throw std::invalid_argument("Invalid HexBoard DSU");
+            }
+
+            for (auto& rk : ranks) 
+                rk = in.u8();
+
+            std::vector<RollbackDSU::Union> unions(in.u16());
+            for (auto& u : unions) {
+                u.child = in.u16();
+                u.bumped = in.u8() != 0;
+
+                if (u.child >= N + 4) 
+                    throw std::invalid_argument("Invalid HexBoard DSU");
+            }
+
+            auto member = [&](int i) {
+                if (i < N) 
+                    return cells[i] == player;
+
+                return (player == PLAYER_1) ? (i == game.VIRT_LEFT || i == game.VIRT_RIGHT) 
+                                            : (i == game.VIRT_TOP || i == game.VIRT_BOTTOM);
+            };
+
+            if (!valid_dsu(parents, ranks, unions, member)) 
+                throw std::invalid_argument("Invalid HexBoard DSU");
+
+            dsu->set_state(std::move(parents), std::move(ranks), std::move(unions));
+        }
+
+        game.board = cells;
+        game.history = history;
+        game.undo_marks.resize(moves);
+
+        // Each player's checkpoints only move forward and stay within its log
+        int last_mark[2] = {0, 0};
+
+        for (size_t i = 0; i < moves; ++i) {
+            const int p = cells[history[i]] - 1;
+            const RollbackDSU& dsu = (p == 0) ? game.dsu_p1 : game.dsu_p2;
+            game.undo_marks[i] = in.u16();
+
+            if (game.undo_marks[i] < last_mark[p] || game.undo_marks[i] > dsu.checkpoint()) 
+                throw std::invalid_argument("Invalid HexBoard DSU");
+
+            last_mark[p] = game.undo_marks[i];
+        }
+
+    } else {
+        // Replay in order so the undo logs match the history
+        for (int idx : history) 
+            game.place(idx, cells[idx]);
+    }
+
+    return game;
+}
+
 // Graph Logic, Heuristics
 void HexBoard::build_adjacency() {
     auto new_adj = std::make_shared<std::vector<std::vector<int>>>();
@@ -213,25 +518,93 @@ int HexBoard::get_shortest_distance(int player) const {
     return 9999;
 }
 
-bool HexBoard::dfs(int idx, int player, std::vector<bool>& visited, std::vector<int>& path) {
-    visited[idx] = true;
-    path.push_back(idx);
+int HexBoard::get_distance_map(int player, bool reverse, std::vector<int>& dist) const {
+    int start = (player == PLAYER_1) ? VIRT_LEFT : VIRT_TOP;
+    int end   = (player == PLAYER_1) ? VIRT_RIGHT : VIRT_BOTTOM;
+
+    if (reverse) 
+        std::swap(start, end);
 
-    int r = idx / cols, c = idx % cols;
-    if ((player == PLAYER_1 && c == cols - 1) || (player == PLAYER_2 && r == rows - 1)) 
-        return true;
+    std::deque<int> dq;
+    dist.assign(adj->size(), 9999);
+
+    dist[start] = 0;
+    dq.push_front(start);
 
-    for (int nb : (*adj)[idx]) {
-        // skip virtual nodes
-        if (nb >= rows * cols) 
+    while (!dq.empty()) {
+        int u = dq.front();
+        dq.pop_front();
+
+        // The far edge must not act as a shortcut between cells
+        if (u == end) 
             continue;
 
-        if (board[nb] == player && !visited[nb]) 
-            if (dfs(nb, player, visited, path)) 
-                return true;
+        for (int v : (*adj)[u]) {
+            int weight = 0;
+
+            if (v < rows * cols) {
+                if (board[v] == EMPTY) 
+                    weight = 1;
+                else if (board[v] != player) 
+                    continue;
+
+            } else if (v != end) {
+                continue; // The other player's edges are not part of the graph
+            }
+
+            if (dist[v] > dist[u] + weight) {
+                dist[v] = dist[u] + weight;
+                if (weight == 0) 
+                    dq.push_front(v);
+                else 
+                    dq.push_back(v);
+            }
+        }
     }
 
-    path.pop_back();
+    return dist[end];
+}
+
+// Depth-first walk over the player's stones with an explicit stack, so long
+// chains on large boards cannot overflow the call stack. On success `path`
+// holds the stones from start to the far edge
+bool HexBoard::trace_path(int start, int player, std::vector<bool>& visited, std::vector<int>& path) const {
+    std::vector<size_t> cursor;     // Next neighbour to try for each stone on the path
+
+    visited[start] = true;
+    path.push_back(start);
+    cursor.push_back(0);
+
+    while (!path.empty()) {
+        int idx = path.back();
+        int r = idx / cols, c = idx % cols;
+
+        if ((player == PLAYER_1 && c == cols - 1) || (player == PLAYER_2 && r == rows - 1)) 
+            return true;
+
+        const auto& neighbors = (*adj)[idx];
+        int next = -1;
+
+        while (cursor.back() < neighbors.size()) {
+            int nb = neighbors[cursor.back()++];
+
+            // skip virtual nodes
+            if (nb < rows * cols && board[nb] == player && !visited[nb]) {
+                next = nb;
+                break;
+            }
+        }
+
+        if (next >= 0) {
+            visited[next] = true;
+            path.push_back(next);
+            cursor.push_back(0);
+        } else {
+            // Dead end, step back
+            path.pop_back();
+            cursor.pop_back();
+        }
+    }
 
     return false;
 }
@@ -244,7 +617,7 @@ std::vector<int> HexBoard::get_winning_path(int player) {
         for (int r = 0; r < rows; ++r) {
             int idx = get_index(r, 0);
 
-            if (board[idx] == player && dfs(idx, player, visited, path)) 
+            if (board[idx] == player && trace_path(idx, player, visited, path)) 
                 return path;
         }
 
@@ -252,7 +625,7 @@ std::vector<int> HexBoard::get_winning_path(int player) {
         for (int c = 0; c < cols; ++c) {
             int idx = get_index(0, c);
             
-            if (board[idx] == player && dfs(idx, player, visited, path)) 
+            if (board[idx] == player && trace_path(idx, player, visited, path)) 
                 return path;
         }
     }
@@ -0,0 +1,163 @@
+#include "PatternTable.hpp"
+
+#include <cmath>
+#include <fstream>
+#include <sstream>
+#include <stdexcept>
+
+PatternTable::PatternTable()
+    : weights(2 * PATTERN_COUNT, 1.0f), uniform(true) {}
+
+namespace {
+    void check_index(int player, int code) {
+        if ((player != PLAYER_1 && player != PLAYER_2) || code < 0 || code >= PatternTable::PATTERN_COUNT) 
+            throw std::out_of_range("Pattern player or code out of range");
+    }
+}
+
+float PatternTable::get_weight(int player, int code) const {
+    check_index(player, code);
+    return weights[(player - 1) * PATTERN_COUNT + code];
+}
+
+void PatternTable::set_weight(int player, int code, float weight) {
+    check_index(player, code);
+    weights[(player - 1) * PATTERN_COUNT + code] = weight;
+    uniform = false;
+}
+
+bool PatternTable::is_uniform() const {
+    return uniform;
+}
+
+bool PatternTable::load(const std::string& path) {
+    std::ifstream in(path);
+    if (!in) 
+        return false;
+
+    std::string magic;
+    int version = 0;
+    in >> magic >> version;
+
+    if (magic != "hexpatterns" || version != 1) 
+        return false;
+
+    std::vector<float> loaded(2 * PATTERN_COUNT, 1.0f);
+    std::string line;
+
+    // One "code w1 w2" entry per line; any malformed line rejects the whole file
+    while (std::getline(in, line)) {
+        std::istringstream fields(line);
+        int code;
+        float w1, w2;
+        std::string extra;
+
+        if (!(fields >> std::ws) || fields.eof()) 
+            continue;   // Blank line
+
+        if (!(fields >> code >> w1 >> w2) || (fields >> extra)) 
+            return false;
+
+        if (code < 0 || code >= PATTERN_COUNT || !std::isfinite(w1) || !std::isfinite(w2) || w1 < 0.0f || w2 < 0.0f) 
+            return false;
+
+        loaded[code] = w1;
+        loaded[PATTERN_COUNT + code] = w2;
+    }
+
+    if (!in.eof()) 
+        return false;
+
+    weights.swap(loaded);
+    uniform = false;
+
+    return true;
+}
+
+bool PatternTable::save(const std::string& path) const {
+    std::ofstream out(path);
+    if (!out) 
+        return false;
+
+    out << "hexpatterns 1\n";
+    for (int code = 0; code < PATTERN_COUNT; ++code) 
+        out << code << " " << weights[code] << " " << weights[PATTERN_COUNT + code] << "\n";
+
+    return static_cast<bool>(out);
+}
+
+void PatternTable::train(const std::vector<std::vector<int>>& games, int rows, int cols, float prior) {
+    // Unseen patterns would get 0 / 0
+    if (!(prior > 0.0f)) 
+        throw std::invalid_argument("Pattern prior must be positive");
+
+    const int N = rows * cols;
+    const auto slots = build_slots(rows, cols);
+
+    std::vector<double> seen(2 * PATTERN_COUNT, 0.0);
+    std::vector<double> played(2 * PATTERN_COUNT, 0.0);
+    std::vector<int> codes(N);
+
+    for (const auto& game : games) {
+        HexBoard board(rows, cols);
+        int player = PLAYER_1;
+
+        for (int i = 0; i < N; ++i) 
+            codes[i] = encode(board, slots[i]);
+
+        for (int move : game) {
+            if (move < 0 || move >= N || board.get_cell_by_index(move) != EMPTY) 
+                break;
+
+            const int base = (player - 1) * PATTERN_COUNT;
+
+            for (int i = 0; i < N; ++i) 
+                if (board.get_cell_by_index(i) == EMPTY) 
+                    seen[base + codes[i]] += 1.0;
+
+            played[base + codes[move]] += 1.0;
+
+            auto [r, c] = board.get_coord(move);
+            board.make_move(r, c, player);
+
+            // Neighbours see the new stone through the opposite slot
+            for (int s = 0; s < SLOTS; ++s) {
+                int nb = slots[move][s];
+                if (nb != -1) 
+                    codes[nb] |= player << shift(SLOTS - 1 - s);
+            }
+
+            player = (player == PLAYER_1) ? PLAYER_2 : PLAYER_1;
+        }
+    }
+
+    // Smoothed selection rate, unseen patterns get the prior's 0.5
+    for (size_t i = 0; i < weights.size(); ++i) 
+        weights[i] = static_cast<float>((played[i] + 0.5 * prior) / (seen[i] + prior));
+
+    uniform = false;
+}
+
+std::vector<PatternTable::Slots> PatternTable::build_slots(int rows, int cols) {
+    // Pointy top, odd rows shifted right (matches HexBoard adjacency)
+    static const int EVEN_OFFSETS[SLOTS][2] = {{-1, -1}, {-1, 0}, {0, -1}, {0, 1}, {1, -1}, {1, 0}};
+    static const int ODD_OFFSETS[SLOTS][2]  = {{-1, 0}, {-1, 1}, {0, -1}, {0, 1}, {1, 0}, {1, 1}};
+
+    std::vector<Slots> slots(rows * cols);
+
+    for (int r = 0; r < rows; ++r) {
+        const auto& offsets = (r % 2 == 0) ? EVEN_OFFSETS : ODD_OFFSETS;
+
+        for (int c = 0; c < cols; ++c) {
+            for (int s = 0; s < SLOTS; ++s) {
+                int nr = r + offsets[s][0];
+                int nc = c + offsets[s][1];
+                bool valid = nr >= 0 && nr < rows && nc >= 0 && nc < cols;
+
+                slots[r * cols + c][s] = valid ? nr * cols + nc : -1;
+            }
+        }
+    }
+
+    return slots;
+}
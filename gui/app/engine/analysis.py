@@ -0,0 +1,120 @@
+# Evaluate every position of recorded games and report per-move win-rate swings
+# Usage (from gui/): python -m app.engine.analysis ../resources/games.hxr --playouts 5000 -o swings.csv
+# Positions are searched in parallel worker processes, each mapping the record file once
+
+import os
+import csv
+import argparse
+
+from concurrent.futures import ProcessPoolExecutor
+
+from app.engine import hexlib
+from app.engine.records import GameRecords
+
+# Per-process record file, opened by the pool initializer
+_records = None
+
+
+def _init_worker(path):
+    global _records
+    _records = GameRecords(path)
+
+
+def other(player):
+    return hexlib.PLAYER_2 if player == hexlib.PLAYER_1 else hexlib.PLAYER_1
+
+
+def search(board, player, config):
+    move = hexlib.HexAI.get_move(board, player, config)
+    return move, hexlib.HexAI.get_analysis()
+
+
+def root_value(board, player, config):
+    # Win rate of the side to move from the root's own playouts, so prior visits
+    # are excluded. A forced block is played first, the position is worth what it is after it
+    if board.check_win() != hexlib.EMPTY:
+        return 0.0
+
+    move, snapshot = search(board, player, config)
+
+    if snapshot.iterations > 0 or snapshot.value == 1.0:
+        return snapshot.value
+
+    board.make_move(*board.get_coord(move), player)
+    value = 1.0 - root_value(board, other(player), config)
+    board.undo()
+
+    return value
+
+
+def evaluate(game, ply, playouts):
+    # Swing of move `ply` against the best move of the same search:
+    # played child win rate minus best child win rate, both from the position before the move
+    moves = _records[game]
+    board = hexlib.HexBoard(_records.rows, _records.cols)
+    board.apply_moves(moves[:ply])
+
+    played = int(moves[ply])
+    player = hexlib.PLAYER_1 if ply % 2 == 0 else hexlib.PLAYER_2
+
+    config = hexlib.SearchConfig()
+    config.time_limit_ms = 0
+    config.max_iterations = playouts
+
+    best, snapshot = search(board, player, config)
+    rates = dict(zip(snapshot.moves, snapshot.win_rates))
+
+    if snapshot.iterations > 0:
+        before = rates[best]
+    else:
+        # Forced win or block, no search ran
+        before = root_value(board, player, config)
+        rates = {best: before}
+
+    if played in rates:
+        after = rates[played]
+    else:
+        # Never expanded, search the position after the move instead
+        board.make_move(*board.get_coord(played), player)
+        after = 1.0 - root_value(board, other(player), config)
+
+    return game, ply, player, played, before, after, after - before
+
+
+def analyze(path, playouts, workers, games=None):
+    with GameRecords(path) as records:
+        games = range(len(records)) if games is None else games
+        lengths = {g: len(records[g]) for g in games}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(path,)) as pool:
+        jobs = [pool.submit(evaluate, g, ply, playouts) for g in games for ply in range(lengths[g])]
+
+        return [job.result() for job in jobs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find win-rate swings in recorded Hex games")
+    parser.add_argument("records")
+    parser.add_argument("--playouts", type=int, default=5000, help="MCTS iterations per position")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--games", type=int, nargs="*", default=None, help="game numbers, all by default")
+    parser.add_argument("--top", type=int, default=10, help="largest drops to print")
+    parser.add_argument("-o", "--output", default="swings.csv")
+    args = parser.parse_args()
+
+    rows = analyze(args.records, args.playouts, args.workers, args.games)
+
+    with open(args.output, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["game", "ply", "player", "move", "before", "after", "swing"])
+        writer.writerows((g, ply, p, m, f"{b:.3f}", f"{a:.3f}", f"{s:+.3f}") for g, ply, p, m, b, a, s in rows)
+
+    print(f"Analysed {len(rows)} moves -> {args.output}")
+
+    for g, ply, player, move, before, after, swing in sorted(rows, key=lambda row: row[-1])[:args.top]:
+        side = "Red" if player == hexlib.PLAYER_1 else "Blue"
+        print(f"game {g} move {ply + 1} ({side}, cell {move}): {before:.2f} -> {after:.2f} ({swing:+.2f})")
+
+
+if __name__ == "__main__":
+    main()
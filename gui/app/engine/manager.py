@@ -1,13 +1,22 @@
+import os
+import time
+import struct
 import random
 import pygame
 import threading
 
 from app.defs import *
+from app.config import hex_cfg
 from app.engine import hexlib
+from app.engine.tuner import search_config
+from app.engine.records import append_game
+from app.utils.perf import perf_monitor
 
 
 class HexGameManager:
 
+    HINT_DIFFICULTY = Difficulty.HARD
+
     def __init__(self, renderer, sound, board_size, mode, difficulty):
         self.renderer = renderer 
         self.sound = sound
@@ -15,8 +24,13 @@ class HexGameManager:
         self.difficulty = difficulty
         self.board_size = board_size
 
+        tuned_path = hex_cfg.get_system("tuned_params")
+        self.search_config = search_config(difficulty, board_size, tuned_path)
+        self.hint_config = search_config(self.HINT_DIFFICULTY, board_size, tuned_path)
+
         self.board = hexlib.HexBoard(board_size, board_size)
         self.turn = PLAYER_1
+        self.ply = 0
         self.last_move = None
         self.winner = EMPTY
         self.winning_path = []
@@ -24,12 +38,31 @@ class HexGameManager:
         self.thinking = False
         self.ai_move = -1
 
+        # Live search overlay, doubles as hint mode in PvP
+        self.show_analysis = False
+        self.analysis = None
+        self.hint_thread = None
+        self.hint_ply = -1
+        self.search_token = None    # Stop token of the search the overlay follows
+        self.last_poll = 0.0
+        self.poll_interval = 1.0 / hex_cfg.get_system("analysis_fps")
+        hexlib.HexAI.set_analysis_interval(int(self.poll_interval * 1000))
+
         if mode == GameMode.PVAI:
             self.human_player = random.choice([PLAYER_1, PLAYER_2])
         else:
             self.human_player = EMPTY
 
     def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_h:
+            self.show_analysis = not self.show_analysis
+            self.analysis = None
+            return
+
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_u, pygame.K_BACKSPACE):
+            self._takeback()
+            return
+
         if self.winner != EMPTY or self.thinking:
             return
 
@@ -44,7 +77,8 @@ class HexGameManager:
         if self.winner == EMPTY and self.mode == GameMode.PVAI and self.turn != self.human_player:
             if not self.thinking:
                 self.thinking = True
-                threading.Thread(target=self._run_ai).start()
+                self.search_token = hexlib.HexAI.stop_token()
+                threading.Thread(target=self._run_ai, args=(self.search_token,)).start()
 
             if self.ai_move != -1:
                 r, c = self.board.get_coord(self.ai_move)
@@ -52,6 +86,12 @@ class HexGameManager:
                 self.ai_move = -1
                 self.thinking = False
 
+        if self.show_analysis and self.winner == EMPTY:
+            if self.mode == GameMode.PVP:
+                self._update_hint()
+
+            self._poll_analysis()
+
     def draw(self):
         self.renderer.draw_game(
             self.board, 
@@ -60,16 +100,53 @@ class HexGameManager:
             self.winner,
             self.thinking,
             self.mode,
-            self.human_player
+            self.human_player,
+            self.analysis if self.show_analysis else None
         )
 
-    def _run_ai(self):
-        self.ai_move = hexlib.HexAI.get_move(self.board, self.turn, self.difficulty)
+    def _run_ai(self, stop_token):
+        start = time.perf_counter()
+        move = hexlib.HexAI.get_move(self.board, self.turn, self.search_config, stop_token)
+        perf_monitor.record_ai((time.perf_counter() - start) * 1000, hexlib.HexAI.get_last_stats())
+
+        self.ai_move = move
+
+    def _run_hint(self, board, turn, stop_token):
+        hexlib.HexAI.get_move(board, turn, self.hint_config, stop_token)
+
+    def _update_hint(self):
+        if self.hint_ply == self.ply:
+            return
+
+        # A stopped search for an older position may still be winding down
+        if self.hint_thread and self.hint_thread.is_alive():
+            return
+
+        self.hint_ply = self.ply
+        board = self.board.clone()
+
+        # Taken here, so a stop() issued before the thread reaches the search still ends it
+        self.search_token = hexlib.HexAI.stop_token()
+        self.hint_thread = threading.Thread(target=self._run_hint, args=(board, self.turn, self.search_token), daemon=True)
+        self.hint_thread.start()
+
+    def _poll_analysis(self):
+        now = time.monotonic()
+        if now - self.last_poll < self.poll_interval:
+            return
+
+        self.last_poll = now
+        snapshot = hexlib.HexAI.get_analysis()
+
+        # Only the search started for the position on the board, see _position_changed
+        self.analysis = snapshot if snapshot.token == self.search_token and snapshot.moves else None
 
     def _attempt_move(self, r, c):
         if self.board.make_move(r, c, self.turn):
             self.sound.play("move")
             self.last_move = (r, c)
+            self.ply += 1
+            self._position_changed()
             
             winner = self.board.check_win()
             if winner != EMPTY:
@@ -78,3 +155,57 @@ class HexGameManager:
                 self.sound.play("win" if is_win else "lose")
             else:
                 self.turn = PLAYER_2 if self.turn == PLAYER_1 else PLAYER_1
+
+    def _takeback(self):
+        history = self.board.get_history()
+        if self.thinking or not history:
+            return
+
+        # Against the AI, take back to the human's previous turn
+        steps = 1
+        if self.mode == GameMode.PVAI:
+            last_player = self.board.get_cell(*self.board.get_coord(history[-1]))
+
+            if last_player != self.human_player:
+                if len(history) < 2:
+                    return
+                steps = 2
+
+        for _ in range(steps):
+            self._undo_move()
+
+    def _undo_move(self):
+        r, c = self.board.get_coord(self.board.get_history()[-1])
+        self.turn = self.board.get_cell(r, c)
+        self.board.undo()
+
+        history = self.board.get_history()
+        self.last_move = self.board.get_coord(history[-1]) if history else None
+        self.ply -= 1
+        self.winner = EMPTY
+        self._position_changed()
+
+    def _position_changed(self):
+        # A new stop generation ends any running search, and the next one takes a token
+        # no earlier search had, so snapshots of older positions never match it
+        hexlib.HexAI.stop()
+        self.search_token = None
+        self.analysis = None
+
+    def close(self):
+        # Recorded on leaving, so a finished game that was taken back and replayed is saved once
+        if self.winner != EMPTY:
+            self._save_record()
+
+        if self.hint_thread and self.hint_thread.is_alive():
+            hexlib.HexAI.stop()
+
+    def _save_record(self):
+        # One file per board size, e.g. games_11.hxr
+        root, ext = os.path.splitext(hex_cfg.get_system("records"))
+        path = f"{root}_{self.board_size}{ext}"
+
+        try:
+            append_game(path, self.board_size, self.board_size, self.board.get_history(), self.winner)
+        except (IOError, ValueError, struct.error) as e:
+            print(f"Failed to save game record: {e}")
@@ -0,0 +1,52 @@
+# Train playout pattern weights from game records
+# Usage (from gui/): python -m app.engine.patterns games.txt --size 11 -o ../resources/patterns.txt
+# Records are plain text, one game per line as space separated cell indices (Red moves first)
+
+import argparse
+
+from app.engine import hexlib
+
+
+def read_games(path):
+    games = []
+
+    with open(path, 'r') as f:
+        for line in f:
+            moves = [int(tok) for tok in line.split()]
+            if moves:
+                games.append(moves)
+
+    return games
+
+
+def train(games, size, prior=1.0):
+    table = hexlib.PatternTable()
+    table.train(games, size, size, prior)
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train Hex playout patterns")
+    parser.add_argument("records", nargs="+")
+    parser.add_argument("--size", type=int, required=True)
+    parser.add_argument("--prior", type=float, default=1.0, help="virtual observations per pattern, must be > 0")
+    parser.add_argument("-o", "--output", default="patterns.txt")
+    args = parser.parse_args()
+
+    if not args.prior > 0:
+        parser.error("--prior must be positive")
+
+    games = []
+    for path in args.records:
+        games.extend(read_games(path))
+
+    table = train(games, args.size, args.prior)
+
+    if not table.save(args.output):
+        raise SystemExit(f"Failed to write {args.output}")
+
+    print(f"Trained on {len(games)} games -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Compact game records, many games per file, read through mmap without copying
+#
+# File layout (little-endian, every field 2-byte aligned):
+#   header: b"HXR1", uint16 rows, uint16 cols
+#   games:  uint16 move count, uint8 winner, uint8 reserved, uint16 moves[count]
+# Moves are cell indices (row * cols + col), Red moves first. Games are appended in place
+
+import os
+import mmap
+import struct
+
+import numpy as np
+
+MAGIC = b"HXR1"
+HEADER = struct.Struct("<4sHH")
+GAME_HEADER = struct.Struct("<HBB")
+
+
+def append_game(path, rows, cols, moves, winner):
+    moves = np.asarray(moves, dtype="<u2")
+
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        with open(path, 'rb') as f:
+            try:
+                magic, file_rows, file_cols = HEADER.unpack(f.read(HEADER.size))
+            except struct.error:
+                raise ValueError(f"{path} is truncated")
+
+        if magic != MAGIC or (file_rows, file_cols) != (rows, cols):
+            raise ValueError(f"{path} is not a {rows}x{cols} game record file")
+
+        mode = 'ab'
+    else:
+        mode = 'wb'
+
+    with open(path, mode) as f:
+        if mode == 'wb':
+            f.write(HEADER.pack(MAGIC, rows, cols))
+
+        f.write(GAME_HEADER.pack(len(moves), winner, 0))
+        f.write(moves.tobytes())
+
+
+class GameRecords:
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty")
+
+        magic, self.rows, self.cols = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a game record file")
+
+        self._moves = np.frombuffer(self._map, dtype="<u2")
+        self._index = []    # (first move offset in uint16 units, count, winner)
+
+        offset = HEADER.size
+        while offset + GAME_HEADER.size <= len(self._map):
+            count, winner, _ = GAME_HEADER.unpack_from(self._map, offset)
+            start = offset + GAME_HEADER.size
+
+            if start + 2 * count > len(self._map):
+                break   # Truncated tail from an interrupted write
+
+            self._index.append((start // 2, count, winner))
+            offset = start + 2 * count
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, i):
+        # Read-only view into the mapped file
+        start, count, _ = self._index[i]
+        return self._moves[start:start + count]
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def winner(self, i):
+        return self._index[i][2]
+
+    def close(self):
+        # Views handed out keep the buffer alive until they are released
+        self._moves = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,177 @@
+# Tune MCTS search parameters with SPSA self-play, one parameter set per board size
+# Usage (from gui/): python -m app.engine.tuner --sizes 7 9 11 -o ../resources/tuned_params.json
+# Each iteration plays a perturbed pair of configs against each other in worker processes
+
+import os
+import json
+import random
+import argparse
+
+from concurrent.futures import ProcessPoolExecutor
+
+from app.engine import hexlib
+
+
+# name, low, high, integer
+PARAMS = [
+    ("uct_exploration",  0.0, 0.6,    False),
+    ("rave_bias",        100, 6000,   False),
+    ("prior_visits",     0,   32,     True),
+    ("prior_own_path",   0.0, 0.3,    False),
+    ("prior_opp_path",   0.0, 0.3,    False),
+    ("prior_bridge",     0.0, 0.3,    False),
+    ("prior_pattern",    0.0, 0.3,    False),
+    ("prior_center",     0.0, 0.2,    False),
+    ("progressive_bias", 0.0, 2.0,    False),
+]
+
+# SPSA gain schedules: a_k = A / (k + 1 + STABILITY)^ALPHA, c_k = C / (k + 1)^GAMMA
+SPSA_A = 0.1
+SPSA_C = 0.1
+SPSA_ALPHA = 0.602
+SPSA_GAMMA = 0.101
+SPSA_STABILITY = 5
+
+# Tuning starts from this preset; fields that define the other presets keep their preset values there
+TUNED_DIFFICULTY = hexlib.Difficulty.HARD
+PRESET_FIELDS = ("time_limit_ms", "rave_bias")
+
+
+def load_tuned(path, size):
+    if not path or not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get(str(size), {})
+
+    except (IOError, ValueError) as e:
+        print(f"Warning: Could not read tuned parameters from {path}: {e}")
+        return {}
+
+
+def apply_tuned(config, values):
+    for name, value in values.items():
+        if hasattr(config, name):
+            setattr(config, name, value)
+
+    return config
+
+
+def search_config(difficulty, size, path=None):
+    # Tuned values replace the search weights; the preset fields only for the tuned difficulty
+    config = hexlib.SearchConfig.from_difficulty(difficulty)
+    values = load_tuned(path, size)
+
+    if difficulty != TUNED_DIFFICULTY:
+        values = {name: v for name, v in values.items() if name not in PRESET_FIELDS}
+
+    return apply_tuned(config, values)
+
+
+def to_values(theta):
+    values = {}
+
+    for x, (name, low, high, integer) in zip(theta, PARAMS):
+        v = low + x * (high - low)
+        values[name] = int(round(v)) if integer else v
+
+    return values
+
+
+def to_theta(config):
+    return [(getattr(config, name) - low) / (high - low) for name, low, high, _ in PARAMS]
+
+
+def clip(theta):
+    return [min(1.0, max(0.0, x)) for x in theta]
+
+
+def play_game(size, red, blue, playouts, seed):
+    # Returns the winner; the first stone is random so paired games differ
+    configs = {}
+    for player, values in ((hexlib.PLAYER_1, red), (hexlib.PLAYER_2, blue)):
+        config = apply_tuned(hexlib.SearchConfig(), values)
+        config.time_limit_ms = 0
+        config.max_iterations = playouts
+        configs[player] = config
+
+    board = hexlib.HexBoard(size, size)
+    rng = random.Random(seed)
+
+    board.make_move(rng.randrange(size), rng.randrange(size), hexlib.PLAYER_1)
+    turn = hexlib.PLAYER_2
+
+    while board.check_win() == hexlib.EMPTY:
+        move = hexlib.HexAI.get_move(board, turn, configs[turn])
+        board.make_move(*board.get_coord(move), turn)
+        turn = hexlib.PLAYER_2 if turn == hexlib.PLAYER_1 else hexlib.PLAYER_1
+
+    return board.check_win()
+
+
+def match(pool, size, plus, minus, pairs, playouts, rng):
+    # Each opening is played twice with colours swapped; returns plus score in [-1, 1]
+    jobs = []
+    for _ in range(pairs):
+        seed = rng.getrandbits(32)
+        jobs.append((pool.submit(play_game, size, plus, minus, playouts, seed), hexlib.PLAYER_1))
+        jobs.append((pool.submit(play_game, size, minus, plus, playouts, seed), hexlib.PLAYER_2))
+
+    score = 0
+    for job, plus_color in jobs:
+        score += 1 if job.result() == plus_color else -1
+
+    return score / len(jobs)
+
+
+def tune(pool, size, iterations, pairs, playouts, rng):
+    theta = clip(to_theta(hexlib.SearchConfig.from_difficulty(TUNED_DIFFICULTY)))
+
+    for k in range(iterations):
+        a_k = SPSA_A / (k + 1 + SPSA_STABILITY) ** SPSA_ALPHA
+        c_k = SPSA_C / (k + 1) ** SPSA_GAMMA
+        delta = [rng.choice((-1, 1)) for _ in PARAMS]
+
+        plus = to_values(clip([x + c_k * d for x, d in zip(theta, delta)]))
+        minus = to_values(clip([x - c_k * d for x, d in zip(theta, delta)]))
+
+        score = match(pool, size, plus, minus, pairs, playouts, rng)
+        theta = clip([x + a_k * score / (2 * c_k) * d for x, d in zip(theta, delta)])
+
+        print(f"[{size}x{size}] iteration {k + 1}/{iterations}: score {score:+.2f}")
+
+    return to_values(theta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune Hex search parameters with SPSA self-play")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[11])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--pairs", type=int, default=8, help="colour-swapped game pairs per iteration")
+    parser.add_argument("--playouts", type=int, default=2000, help="MCTS iterations per move")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("-o", "--output", default="tuned_params.json")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    results = {}
+    if os.path.exists(args.output):
+        with open(args.output, 'r') as f:
+            results = json.load(f)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for size in args.sizes:
+            results[str(size)] = tune(pool, size, args.iterations, args.pairs, args.playouts, rng)
+
+            # Save after every size so a long run can be interrupted
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=4)
+
+    print(f"Tuned sizes {args.sizes} -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Headless renderer and search timings per board size, for automated performance runs
+# Usage (from gui/): python -m app.ui.bench --sizes 7 11 15 19 --frames 300 --playouts 5000 -o perf.json
+# Frames are drawn into the dummy SDL video driver, so no window or display is needed
+
+import os
+import json
+import time
+import random
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from app.defs import *
+from app.config import hex_cfg
+from app.engine import hexlib
+from app.ui.renderer import HexRenderer
+from app.utils.perf import PerfMonitor
+
+
+def random_position(size, fill, rng):
+    # Alternating random stones on `fill` of the cells, stopping short of a finished game
+    board = hexlib.HexBoard(size, size)
+    cells = list(range(size * size))
+    rng.shuffle(cells)
+
+    turn = hexlib.PLAYER_1
+    for idx in cells[:int(len(cells) * fill)]:
+        board.make_move(*board.get_coord(idx), turn)
+
+        if board.check_win() != hexlib.EMPTY:
+            board.undo()
+            break
+
+        turn = hexlib.PLAYER_2 if turn == hexlib.PLAYER_1 else hexlib.PLAYER_1
+
+    return board, turn
+
+
+def bench_size(screen, size, frames, playouts, fill, rng):
+    monitor = PerfMonitor(window=max(frames, 1))
+    renderer = HexRenderer(screen, size)
+    board, turn = random_position(size, fill, rng)
+    history = board.get_history()
+    last_move = board.get_coord(history[-1]) if history else None
+
+    analysis = None
+    if playouts > 0:
+        config = hexlib.SearchConfig()
+        config.time_limit_ms = 0
+        config.max_iterations = playouts
+
+        start = time.perf_counter()
+        hexlib.HexAI.get_move(board, turn, config)
+        monitor.record_ai((time.perf_counter() - start) * 1000, hexlib.HexAI.get_last_stats())
+
+        analysis = hexlib.HexAI.get_analysis()
+
+    for _ in range(frames):
+        start = time.perf_counter()
+        renderer.draw_game(board, turn, last_move, mode=GameMode.PVP, analysis=analysis)
+        pygame.display.flip()
+        elapsed = (time.perf_counter() - start) * 1000
+
+        monitor.record_draw("GameState", elapsed)
+        monitor.record_frame(elapsed)
+
+    return monitor.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time board rendering and AI moves without a display")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[7, 9, 11, 13, 15, 19, 25])
+    parser.add_argument("--frames", type=int, default=300, help="frames drawn per size")
+    parser.add_argument("--playouts", type=int, default=5000, help="MCTS iterations for the timed AI move, 0 to skip")
+    parser.add_argument("--fill", type=float, default=0.5, help="fraction of cells holding stones")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default=None, help="write the results as JSON")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((hex_cfg.get_system("width"), hex_cfg.get_system("height")))
+    rng = random.Random(args.seed)
+
+    results = {}
+    for size in args.sizes:
+        s = bench_size(screen, size, args.frames, args.playouts, args.fill, rng)
+        results[str(size)] = s
+
+        frame = " / ".join(f"{v:.2f}" for v in s["frame_ms"].values())
+        ai = " / ".join(f"{v:.1f}" for v in s["ai_ms"].values()) or "-"
+        print(f"{size}x{size}: frame p50/p95/p99 {frame} ms, ai {ai} ms, {s['playouts_per_sec']:,.0f} playouts/s")
+
+    pygame.quit()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=4)
+
+        print(f"Results -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
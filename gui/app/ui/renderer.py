@@ -16,12 +16,19 @@ class HexRenderer:
             hex_cfg.get_system("font_name"), 
             hex_cfg.get_system("font_size")
         )
+        self.small_font = pygame.font.SysFont(
+            hex_cfg.get_system("font_name"), 
+            hex_cfg.get_system("font_size") * 2 // 3
+        )
 
         self._recalculate_layout()
 
-    def draw_game(self, board, turn, last_move=None, winner=None, thinking=False, mode=None, human_player=None):
+    def draw_game(self, board, turn, last_move=None, winner=None, thinking=False, mode=None, human_player=None, analysis=None):
         self.screen.fill(hex_cfg.get_color("bg"))
         self._draw_board(board, turn, last_move)
+
+        if analysis and not winner:
+            self._draw_analysis(board, analysis)
         
         if winner:
             self._draw_winning_path(board, winner)
@@ -59,23 +66,31 @@ class HexRenderer:
 
         return int(x + self.off_x), int(y + self.off_y)
 
+    # Room kept free above the board for the turn / analysis text, and around it
+    TOP_MARGIN = 70
+    MARGIN = 30
+
     def _recalculate_layout(self):
-        self.tile_size = hex_cfg.get_system("tile_size")
+        # Largest tile up to the configured size that fits the whole board in the window
+        width, height = hex_cfg.get_system("width"), hex_cfg.get_system("height")
+        avail_w = width - 2 * self.MARGIN
+        avail_h = height - self.TOP_MARGIN - self.MARGIN
 
-        if self.board_size > 15: 
-            self.tile_size -= 12
-        elif self.board_size > 11: 
-            self.tile_size -= 8
+        # Odd rows are shifted half a hex right; rows overlap by a quarter hex height
+        fit_w = avail_w / ((self.board_size + 0.5) * math.sqrt(3))
+        fit_h = avail_h / (1.5 * self.board_size + 0.5)
+        self.tile_size = max(4, int(min(hex_cfg.get_system("tile_size"), fit_w, fit_h)))
 
         hex_w, hex_h = self.tile_size * math.sqrt(3), self.tile_size * 2
 
-        board_px_w = 0.75 * hex_w * self.board_size + hex_w
-        board_px_h = hex_h * self.board_size
+        board_px_w = (self.board_size + 0.5) * hex_w
+        board_px_h = (1.5 * self.board_size + 0.5) * self.tile_size
 
-        self.off_x = int((hex_cfg.get_system("width") - board_px_w) // 2)
-        self.off_y = (hex_cfg.get_system("height") - board_px_h) // 2 + 100
+        # Offsets locate the centre of cell (0, 0)
+        self.off_x = int((width - board_px_w) // 2 + hex_w / 2)
+        self.off_y = int(self.TOP_MARGIN + (avail_h - board_px_h) // 2 + hex_h / 2)
 
-    @lru_cache(maxsize=256)
+    @lru_cache(maxsize=4096)
     def _get_hex_corners(self, cx, cy, size=None):
         # Get (x, y) corners of hex
         # Order: [TopRight, BottomRight, Bottom, BottomLeft, TopLeft, Top]
@@ -116,6 +131,31 @@ class HexRenderer:
         surf = self.font.render(text, True, color)
         self.screen.blit(surf, (140, 25))
 
+    def _draw_analysis(self, board, analysis):
+        # Heatmap of root visits + numbered principal variation
+        max_visits = max(max(analysis.visits), 1)
+        heat = hex_cfg.get_color("heatmap")
+
+        for move, visits in zip(analysis.moves, analysis.visits):
+            r, c = board.get_coord(move)
+            cx, cy = self.grid_to_pixel(r, c)
+            alpha = int(30 + 170 * visits / max_visits)
+            points = self._get_hex_corners(cx, cy, self.tile_size * 0.85)
+            pygame.gfxdraw.filled_polygon(self.screen, points, (*heat, alpha))
+
+        for i, move in enumerate(analysis.pv):
+            mover = analysis.player if i % 2 == 0 else (PLAYER_2 if analysis.player == PLAYER_1 else PLAYER_1)
+            color = hex_cfg.get_color("p1") if mover == PLAYER_1 else hex_cfg.get_color("p2")
+
+            r, c = board.get_coord(move)
+            surf = self.small_font.render(str(i + 1), True, color)
+            self.screen.blit(surf, surf.get_rect(center=self.grid_to_pixel(r, c)))
+
+        best = analysis.moves.index(analysis.pv[0]) if analysis.pv else 0
+        text = f"Win: {analysis.win_rates[best]:.0%}  ({analysis.iterations} playouts)"
+        surf = self.small_font.render(text, True, hex_cfg.get_color("text"))
+        self.screen.blit(surf, surf.get_rect(topright=(hex_cfg.get_system("width") - 20, 30)))
+
     def _draw_overlay_text(self, text, font_size, color):
         cx, cy = hex_cfg.get_system("width") // 2, hex_cfg.get_system("height") // 2
         font = pygame.font.SysFont(hex_cfg.get_system("font_name"), font_size)
@@ -21,6 +21,9 @@ class State:
     def draw(self) -> None:
         pass
 
+    def exit(self) -> None:
+        pass
+
 
 class UIState(State):
 
@@ -92,7 +95,7 @@ class SettingsState(UIState):
         self.slider_music = Slider(cx + 50, 285, 200, 20, 0.0, 1.0, current_music)
         self.slider_sfx = Slider(cx + 50, 345, 200, 20, 0.0, 1.0, current_sfx)
         self.selector_size = Selector(cx + 50, 195, 200, 40,
-                                      [7, 9, 11, 13, 15],
+                                      [7, 9, 11, 13, 15, 19, 25],
                                       current_size,
                                       self._set_size)
 
@@ -213,3 +216,6 @@ class GameState(State):
     def draw(self):
         self.manager.draw()
         self.menu_btn.draw(self.app.screen)
+
+    def exit(self):
+        self.manager.close()
@@ -1 +1,2 @@
 from .sound import SoundManager
+from .perf import PerfMonitor, perf_monitor
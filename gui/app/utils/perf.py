@@ -0,0 +1,126 @@
+import json
+import time
+import threading
+from collections import deque
+
+import pygame
+
+from app.config import hex_cfg
+
+
+class PerfMonitor:
+
+    # Samples kept per metric, roughly 10 seconds of frames at 60 fps
+    WINDOW = 600
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.visible = False    # Only the HUD, samples are collected and logged either way
+        self.log_path = None
+        self.log_interval = 5.0
+        self.last_log = time.monotonic()
+
+        self.frame_ms = deque(maxlen=window)
+        self.draw_ms = {}
+        self.ai_ms = deque(maxlen=window)
+        self.playouts_per_sec = deque(maxlen=window)
+
+        # AI samples arrive from the search thread
+        self._lock = threading.Lock()
+        self._font = None
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def record_frame(self, ms):
+        self.frame_ms.append(ms)
+        self._maybe_log()
+
+    def record_draw(self, state, ms):
+        if state not in self.draw_ms:
+            self.draw_ms[state] = deque(maxlen=self.window)
+
+        self.draw_ms[state].append(ms)
+
+    def record_ai(self, ms, stats=None):
+        with self._lock:
+            self.ai_ms.append(ms)
+
+            if stats is not None and stats.playouts > 0:
+                self.playouts_per_sec.append(stats.playouts_per_sec)
+
+    @staticmethod
+    def percentiles(samples, points=PERCENTILES):
+        if not samples:
+            return {}
+
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+
+        return {f"p{p}": ordered[min(last, round(last * p / 100))] for p in points}
+
+    def summary(self):
+        with self._lock:
+            ai_ms = list(self.ai_ms)
+            playouts = list(self.playouts_per_sec)
+
+        return {
+            "frame_ms": self.percentiles(self.frame_ms),
+            "draw_ms": {state: self.percentiles(samples) for state, samples in self.draw_ms.items()},
+            "ai_ms": self.percentiles(ai_ms),
+            "playouts_per_sec": sum(playouts) / len(playouts) if playouts else 0.0,
+        }
+
+    def draw(self, screen):
+        if self._font is None:
+            self._font = pygame.font.SysFont("monospace", 14)
+
+        s = self.summary()
+        lines = [f"frame  {self._format(s['frame_ms'])}"]
+
+        for state, values in s["draw_ms"].items():
+            lines.append(f"draw   {self._format(values)}  {state}")
+
+        lines.append(f"ai     {self._format(s['ai_ms'])}")
+        lines.append(f"search {s['playouts_per_sec']:,.0f} playouts/s")
+
+        surfs = [self._font.render(line, True, hex_cfg.get_color("text")) for line in lines]
+        width = max(surf.get_width() for surf in surfs) + 16
+        height = sum(surf.get_height() for surf in surfs) + 12
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        y = 6
+        for surf in surfs:
+            panel.blit(surf, (8, y))
+            y += surf.get_height()
+
+        screen.blit(panel, (10, hex_cfg.get_system("height") - height - 10))
+
+    def _format(self, values):
+        if not values:
+            return "-"
+
+        return " / ".join(f"{v:6.1f}" for v in values.values()) + " ms"
+
+    def _maybe_log(self):
+        # Rolling log, shown or not: one JSON line with the current window every log_interval seconds
+        now = time.monotonic()
+        if not self.log_path or now - self.last_log < self.log_interval:
+            return
+
+        self.last_log = now
+        entry = {"time": time.time(), **self.summary()}
+
+        try:
+            with open(self.log_path, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+
+        except IOError as e:
+            print(f"Failed to write performance log: {e}")
+            self.log_path = None
+
+
+perf_monitor = PerfMonitor()
@@ -1,10 +1,12 @@
 import os
 import sys
+import time
 import pygame
 
 from app.ui import MenuState
 from app.config import hex_cfg
-from app.utils import SoundManager
+from app.engine import hexlib
+from app.utils import SoundManager, perf_monitor
 
 
 class Hex:
@@ -23,13 +25,28 @@ class Hex:
         self.sound = SoundManager(hex_cfg.get_default("music_volume"), hex_cfg.get_default("sfx_volume"))
         self.clock = pygame.time.Clock()
 
+        # Trained playout patterns are optional, uniform random playouts otherwise
+        patterns_path = hex_cfg.get_system("patterns")
+        if os.path.exists(patterns_path) and not hexlib.HexAI.load_patterns(patterns_path):
+            print(f"Warning: Could not load patterns from {patterns_path}")
+
+        # Frame / draw / AI timings are logged throughout, F3 shows them
+        perf_monitor.log_path = hex_cfg.get_system("perf_log")
+
         # Start with main menu state
+        self.state = None
         self.set_state(MenuState)
 
     def set_state(self, state, **kwargs):
+        if self.state:
+            self.state.exit()
+
         self.state = state(self, **kwargs)
 
     def quit(self):
+        if self.state:
+            self.state.exit()
+
         hex_cfg.save()
         pygame.quit()
         sys.exit()
@@ -39,6 +56,10 @@ class Hex:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.quit()
+
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    perf_monitor.toggle()
+                    continue
             
                 if self.state:
                     self.state.handle_event(event)
@@ -47,10 +68,15 @@ class Hex:
                 self.state.update()
 
             if self.state:
+                start = time.perf_counter()
                 self.state.draw()
+                perf_monitor.record_draw(type(self.state).__name__, (time.perf_counter() - start) * 1000)
+
+            if perf_monitor.visible:
+                perf_monitor.draw(self.screen)
 
             pygame.display.flip()
-            self.clock.tick(hex_cfg.get_system("fps"))
+            perf_monitor.record_frame(self.clock.tick(hex_cfg.get_system("fps")))
 
 
 if __name__ == "__main__":